@@ -4,11 +4,17 @@ Enhanced Naukri.com Job Application Automation Script
 Advanced version with better external application detection and improved form handling
 """
 
+import os
 import time
 import json
 import csv
 import logging
 import re
+import sqlite3
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from typing import List, Dict, Optional, Set
 from dataclasses import dataclass
@@ -19,9 +25,12 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
+from selenium.common.exceptions import (TimeoutException, NoSuchElementException, ElementClickInterceptedException,
+                                        JavascriptException, NoSuchWindowException, WebDriverException)
 from urllib.parse import urljoin, urlparse, parse_qs
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 
 # Configure logging
@@ -35,6 +44,133 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+APPLIED_JOBS_CSV = 'output/applied_jobs.csv'
+APPLIED_JOBS_DB = 'output/applied_jobs.sqlite'
+COOKIES_FILE = 'output/naukri_cookies.json'
+APPLIED_JOBS_HEADER = ['URL', 'Job ID', 'Title', 'Company', 'Location', 'Applied Date', 'Status']
+SHORTLISTED_JOBS_HEADER = ['Title', 'Company', 'Location', 'Experience', 'Salary', 'URL', 'Job ID', 'External Reason']
+
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+SEARCH_KEYWORDS = "backend java developer spring boot"
+# Listing pages render server side; {location} is empty or "-in-<city>"
+SEARCH_URL_TEMPLATE = "https://www.naukri.com/{slug}-jobs{location}?experience={experience}&pageNo={page}"
+LISTING_RETRY = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+
+# Describes every field of the form in arguments[0]; the element references come back as WebElements
+DESCRIBE_FORM_FIELDS_JS = """
+return Array.from(arguments[0].querySelectorAll('input, select, textarea')).map(el => ({
+    element: el,
+    tag: el.tagName.toLowerCase(),
+    type: (el.type || '').toLowerCase(),
+    name: el.name || '',
+    id: el.id || '',
+    placeholder: el.placeholder || '',
+    value: el.value || '',
+    checked: !!el.checked,
+    options: el.tagName === 'SELECT' ? Array.from(el.options).map(option => option.text) : []
+}));
+"""
+
+# Text field dispatch table: (keywords that must all appear in the field name, config key, default),
+# checked in order so the first match wins
+TEXT_FIELD_MAP = [
+    (("experience", "years"), 'experience_years', 3),
+    (("notice",), 'notice_period', '30'),
+    (("expected", "salary"), 'expected_salary', '800000'),
+    (("current", "salary"), 'current_salary', '600000'),
+    (("mobile",), 'mobile', ''),
+    (("phone",), 'mobile', ''),
+    (("email",), 'email', ''),
+]
+
+# Common patterns for job IDs in Naukri URLs, compiled once
+JOB_ID_PATTERNS = [re.compile(pattern) for pattern in (r'jobid=(\d+)', r'jobId=(\d+)', r'/job/(\d+)', r'id=(\d+)')]
+
+# Requests aborted by the browser before they are sent: images, fonts, media and trackers
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.woff", "*.woff2", "*.ttf",
+    "*.ico", "*.mp4", "*.webm",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*", "*facebook.net*", "*hotjar*",
+    "*clarity.ms*", "*criteo.com*",
+]
+
+# Locators are built once at import time instead of on every lookup
+USERNAME_FIELD = (By.ID, "usernameField")
+PASSWORD_FIELD = (By.ID, "passwordField")
+LOGIN_BUTTON = (By.XPATH, "//button[contains(text(), 'Login')]")
+LOGGED_IN_MARKER = (By.CLASS_NAME, "user-name")
+SEARCH_BOX = (By.CLASS_NAME, "suggestor-input")
+JOB_CARDS = (By.CSS_SELECTOR, ".jobTuple")
+LOCATION_INPUT = (By.CSS_SELECTOR, ".location-input")
+LOCATION_OPTION = (By.CSS_SELECTOR, ".location-dropdown .option")
+NEXT_PAGE_BUTTON = (By.CSS_SELECTOR, ".pagination .next")
+NAUKRI_DOMAINS = frozenset({'naukri.com', 'www.naukri.com'})
+
+# Each candidate list is matched with one XPath union and one CSS selector list,
+# so a lookup costs two driver calls instead of one failing call per selector
+POPUP_XPATH = ("//button[contains(text(), 'Skip')] | //button[contains(text(), 'Later')] | "
+               "//button[contains(text(), 'Not Now')] | //span[contains(@class, 'close')]")
+POPUP_CSS = ".close-popup, .modal-close"
+# Experience filter labels in order of preference, matched with one XPath
+EXPERIENCE_FILTER_LABELS = ('3-5 Yrs', '3+ Yrs', '3 Yrs')
+EXPERIENCE_FILTER_XPATH = "//span[" + " or ".join(f"contains(text(), '{label}')" for label in EXPERIENCE_FILTER_LABELS) + "]"
+APPLY_BUTTON_XPATH = ("//button[contains(text(), 'Apply')] | //a[contains(text(), 'Apply')] | "
+                      "//span[contains(text(), 'Apply')] | //div[contains(text(), 'Apply')]")
+APPLY_BUTTON_CSS = ".apply-button, #apply-button, .job-apply-btn, .apply-now, [data-testid='apply-button']"
+# Returns the first visible, enabled element matching the XPath in arguments[0] or the CSS in arguments[1],
+# searched under arguments[2] (the whole document by default)
+FIRST_ACTIONABLE_JS = """
+const root = arguments[2] || document;
+const found = document.evaluate(arguments[0], root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const candidates = [];
+for (let i = 0; i < found.snapshotLength; i++) {
+    candidates.push(found.snapshotItem(i));
+}
+candidates.push(...root.querySelectorAll(arguments[1]));
+return candidates.find(el => el.getClientRects().length > 0 && !el.disabled) || null;
+"""
+SUBMIT_BUTTON_CSS = "button[type='submit'], input[type='submit'], .submit-btn, .apply-submit"
+SUBMIT_BUTTON_XPATH = ".//button[contains(text(), 'Submit')] | .//button[contains(text(), 'Apply')]"
+APPLICATION_FORM_CSS = "form, .application-form, .job-application, .apply-form"
+SUCCESS_MESSAGE_XPATH = ("//div[contains(text(), 'Application submitted') or "
+                         "contains(text(), 'Applied successfully') or "
+                         "contains(text(), 'Thank you for applying')]")
+
+# Scrapes every job card on the page that is not in arguments[0] (jobs handled by earlier runs,
+# compared by canonical URL); missing fields come back as null
+EXTRACT_JOB_CARDS_JS = """
+const applied = new Set(arguments[0] || []);
+const text = (card, selector) => {
+    const el = card.querySelector(selector);
+    return el ? el.innerText.trim() : null;
+};
+const cards = [];
+for (const card of document.querySelectorAll('.jobTuple')) {
+    const link = card.querySelector('.title a');
+    if (link && applied.has(link.href.replace(/[?#].*$/, '').replace(/\/+$/, ''))) {
+        continue;
+    }
+    cards.push({
+        title: text(card, '.title'),
+        company: text(card, '.subTitle'),
+        location: text(card, '.location'),
+        experience: text(card, '.experience'),
+        salary: text(card, '.salary'),
+        url: link ? link.href : null,
+        posted: text(card, '.postedDate')
+    });
+}
+return cards;
+"""
+
+# Tracking query strings and fragments make the same job look like different URLs
+_TRACKING_RE = re.compile(r"[?#].*$")
+
+def canonical_job_url(url: str) -> str:
+    """Strip tracking parameters so a job has a single URL for dedup and history"""
+    return _TRACKING_RE.sub("", url).rstrip("/")
+
 @dataclass
 class JobDetails:
     """Enhanced data class to store job information"""
@@ -53,15 +189,62 @@ class JobDetails:
     application_date: Optional[str] = None
     application_status: str = "pending"
 
+@dataclass
+class BrowserSession:
+    """A Chrome driver together with the helpers bound to it"""
+    driver: webdriver.Chrome
+    wait: WebDriverWait
+    short_wait: WebDriverWait
+    actions: ActionChains
+    # time.monotonic() before which the session should not start another application
+    ready_at: float = 0.0
+
+class BrowserPool:
+    """Fixed set of logged-in browser sessions shared by worker threads"""
+    
+    def __init__(self, sessions: List[BrowserSession]):
+        self._sessions = queue.Queue()
+        for session in sessions:
+            self._sessions.put(session)
+    
+    @property
+    def size(self) -> int:
+        return self._sessions.qsize()
+    
+    def acquire(self) -> BrowserSession:
+        return self._sessions.get()
+    
+    def release(self, session: BrowserSession):
+        self._sessions.put(session)
+    
+    @contextmanager
+    def session(self):
+        """Borrow a session for the duration of a with-block"""
+        session = self.acquire()
+        try:
+            yield session
+        finally:
+            self.release(session)
+
 class EnhancedNaukriJobApplier:
     """Enhanced class for automating Naukri.com job applications"""
     
     def __init__(self, config_file: str = "config.json"):
         self.config = self.load_config(config_file)
-        self.driver = None
+        self.main_session = None
+        self._local = threading.local()
+        self._save_lock = threading.Lock()
+        self.db = None
         self.applied_jobs = self.load_applied_jobs()
+        # Jobs handled by earlier runs, applied or shortlisted; skipped at extraction
+        self.known_jobs = self.applied_jobs | self.load_shortlisted_urls()
+        self.open_applied_jobs_csv()
         self.shortlisted_jobs = []
+        # Opened on the first shortlisted job, so runs without any leave no empty file
+        self._shortlist_csv = None
         self.failed_applications = []
+        # Shared by every output file of a run so they can be matched up
+        self.run_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         self.setup_driver()
         
         # External application patterns
@@ -84,6 +267,18 @@ class EnhancedNaukriJobApplier:
             'ashbyhq.com', 'smartrecruiters.com', 'jobvite.com',
             'icims.com', 'taleo.net', 'successfactors.com'
         }
+        
+        # Fuse each list into one alternation so a URL is scanned once per list;
+        # named groups map a pattern match back to its source for the reason string
+        self._external_pattern_regex = re.compile(
+            "|".join(f"(?P<p{i}>{pattern})" for i, pattern in enumerate(self.external_patterns)),
+            re.IGNORECASE
+        )
+        self._external_domain_regex = re.compile(
+            "|".join(re.escape(domain) for domain in sorted(self.external_domains)),
+            re.IGNORECASE
+        )
+        self._external_cache: Dict[str, tuple[bool, str]] = {}
     
     def load_config(self, config_file: str) -> Dict:
         """Load configuration from JSON file"""
@@ -95,85 +290,206 @@ class EnhancedNaukriJobApplier:
             raise
     
     def load_applied_jobs(self) -> Set[str]:
-        """Load previously applied jobs from CSV"""
-        applied_jobs = set()
+        """Load previously applied jobs from the sqlite index"""
+        os.makedirs('output', exist_ok=True)
+        # Worker threads write through the same connection, serialized by _save_lock
+        self.db = sqlite3.connect(APPLIED_JOBS_DB, check_same_thread=False)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS applied (url TEXT PRIMARY KEY, job_id TEXT, title TEXT, "
+            "company TEXT, location TEXT, applied_date TEXT, status TEXT)"
+        )
+        applied_jobs = {canonical_job_url(row[0]) for row in self.db.execute("SELECT url FROM applied")}
+        
+        if not applied_jobs:
+            applied_jobs = self.import_applied_jobs_csv()
+        if not applied_jobs:
+            logger.info("No previous applications found. Starting fresh.")
+        return applied_jobs
+    
+    def load_shortlisted_urls(self) -> Set[str]:
+        """Load jobs shortlisted by earlier runs, which were already written to their shortlist CSVs"""
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS shortlisted (url TEXT PRIMARY KEY, job_id TEXT, reason TEXT, "
+            "shortlisted_date TEXT)"
+        )
+        return {canonical_job_url(row[0]) for row in self.db.execute("SELECT url FROM shortlisted")}
+    
+    def import_applied_jobs_csv(self) -> Set[str]:
+        """Seed the sqlite index from an applied_jobs.csv written by earlier versions"""
         try:
-            with open('output/applied_jobs.csv', 'r', newline='') as f:
+            with open(APPLIED_JOBS_CSV, 'r', newline='') as f:
                 reader = csv.reader(f)
                 next(reader, None)  # Skip header
-                for row in reader:
-                    if row and len(row) > 0:
-                        applied_jobs.add(row[0])  # Job URL
+                rows = [(row + [''] * 7)[:7] for row in reader if row]
         except FileNotFoundError:
-            logger.info("No previous applications found. Starting fresh.")
-        return applied_jobs
+            return set()
+        
+        with self.db:
+            self.db.executemany("INSERT OR IGNORE INTO applied VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        return {canonical_job_url(row[0]) for row in rows}
+    
+    def open_applied_jobs_csv(self):
+        """Open the applied jobs CSV once for the whole run"""
+        self._applied_csv = open(APPLIED_JOBS_CSV, 'a', newline='', buffering=8192)
+        self._applied_writer = csv.writer(self._applied_csv)
+        self._unflushed_rows = 0
+        # Append mode starts at the end of the file, so position 0 means it is new or empty
+        if self._applied_csv.tell() == 0:
+            self._applied_writer.writerow(APPLIED_JOBS_HEADER)
+    
+    def close_applied_jobs_csv(self):
+        """Flush and close the applied jobs CSV"""
+        with self._save_lock:
+            if not self._applied_csv.closed:
+                self._applied_csv.close()
     
     def save_applied_job(self, job: JobDetails):
-        """Save applied job to CSV"""
-        os.makedirs('output', exist_ok=True)
-        with open('output/applied_jobs.csv', 'a', newline='') as f:
-            writer = csv.writer(f)
-            # Check if file is empty to write header
-            if f.tell() == 0:
-                writer.writerow(['URL', 'Job ID', 'Title', 'Company', 'Location', 'Applied Date', 'Status'])
-            writer.writerow([
-                job.url, job.job_id, job.title, job.company, 
-                job.location, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 
-                job.application_status
-            ])
+        """Save applied job to the sqlite index and CSV"""
+        row = [
+            job.url, job.job_id, job.title, job.company,
+            job.location, datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            job.application_status
+        ]
+        with self._save_lock:
+            with self.db:
+                self.db.execute("INSERT OR IGNORE INTO applied VALUES (?, ?, ?, ?, ?, ?, ?)", row)
+            
+            # Keep the human-readable CSV record as well, flushed every few rows
+            self._applied_writer.writerow(row)
+            self._unflushed_rows += 1
+            if self._unflushed_rows >= 10:
+                self._applied_csv.flush()
+                self._unflushed_rows = 0
     
     def setup_driver(self):
-        """Setup Chrome WebDriver with enhanced options"""
+        """Setup the main browser session"""
+        self.main_session = self.create_session(self.config.get('chrome_profile_dir'))
+    
+    def create_session(self, profile_dir: Optional[str] = None) -> BrowserSession:
+        """Create a Chrome WebDriver session with enhanced options"""
         chrome_options = Options()
+        if profile_dir:
+            # A persistent profile keeps the HTTP cache and cookies warm across runs
+            chrome_options.add_argument(f"--user-data-dir={os.path.abspath(os.path.expanduser(profile_dir))}")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_argument("--disable-extensions")
         chrome_options.add_argument("--disable-plugins")
-        chrome_options.add_argument("--disable-images")  # Faster loading
+        chrome_options.add_argument("--disable-sync")
+        chrome_options.add_argument("--disable-features=Translate,MediaRouter")
+        chrome_options.add_argument("--disable-background-networking")
+        # Chrome has no --disable-images switch; Blink's setting skips fetching and decoding images
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+        chrome_options.add_argument(f"--user-agent={USER_AGENT}")
+        # Return from navigation at DOMContentLoaded; explicit waits cover late content
+        chrome_options.page_load_strategy = "eager"
+        
+        # Set "headless": true in config.json to run without a browser window
+        if self.config.get('headless'):
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument("--window-size=1920,1080")
         
-        # Uncomment for headless mode
-        # chrome_options.add_argument("--headless")
+        driver = webdriver.Chrome(options=chrome_options)
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
-        self.driver = webdriver.Chrome(options=chrome_options)
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        self.wait = WebDriverWait(self.driver, 15)
-        self.actions = ActionChains(self.driver)
+        # The Blink setting only covers images; block fonts and analytics at the network layer too
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except WebDriverException as e:
+            logger.warning(f"Could not enable network request blocking: {str(e)}")
+        
+        return BrowserSession(
+            driver=driver,
+            wait=WebDriverWait(driver, 15),
+            short_wait=WebDriverWait(driver, 3),
+            actions=ActionChains(driver)
+        )
+    
+    @property
+    def session(self) -> BrowserSession:
+        """Browser session used by the current thread (the main session by default)"""
+        return getattr(self._local, 'session', None) or self.main_session
+    
+    @property
+    def driver(self) -> webdriver.Chrome:
+        return self.session.driver
+    
+    @property
+    def wait(self) -> WebDriverWait:
+        return self.session.wait
+    
+    @property
+    def short_wait(self) -> WebDriverWait:
+        return self.session.short_wait
+    
+    @property
+    def actions(self) -> ActionChains:
+        return self.session.actions
+    
+    @contextmanager
+    def use_session(self, session: BrowserSession):
+        """Route this thread's browser calls to the given session"""
+        previous = getattr(self._local, 'session', None)
+        self._local.session = session
+        try:
+            yield session
+        finally:
+            self._local.session = previous
+    
+    def wait_for(self, locator, condition=EC.presence_of_element_located, timeout: Optional[float] = None):
+        """Wait for a condition on a locator instead of sleeping for a fixed time"""
+        wait = self.wait if timeout is None else WebDriverWait(self.driver, timeout)
+        return wait.until(condition(locator))
+    
+    def first_job_card(self):
+        """Return the first job card on the page, or None if there is none"""
+        cards = self.driver.find_elements(*JOB_CARDS)
+        return cards[0] if cards else None
+    
+    def wait_until_stale(self, element):
+        """Wait briefly for an element to be detached after an action re-renders the page"""
+        if element is None:
+            return
+        try:
+            self.short_wait.until(EC.staleness_of(element))
+        except TimeoutException:
+            pass
     
     def login(self):
         """Enhanced login with better error handling"""
+        if self.restore_session():
+            return
+        
         try:
             logger.info("Logging into Naukri.com...")
             self.driver.get("https://www.naukri.com/nlogin/login")
-            time.sleep(3)
             
             # Handle potential popups
             self.handle_popups()
             
             # Wait for login form
-            email_field = self.wait.until(EC.presence_of_element_located((By.ID, "usernameField")))
-            password_field = self.driver.find_element(By.ID, "passwordField")
+            email_field = self.wait_for(USERNAME_FIELD)
+            password_field = self.driver.find_element(*PASSWORD_FIELD)
             
             # Clear and enter credentials
             email_field.clear()
             email_field.send_keys(self.config['email'])
-            time.sleep(1)
             
             password_field.clear()
             password_field.send_keys(self.config['password'])
-            time.sleep(1)
             
             # Click login button
-            login_button = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Login')]")
+            login_button = self.driver.find_element(*LOGIN_BUTTON)
             login_button.click()
             
             # Wait for successful login
-            self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, "user-name")))
+            self.wait_for(LOGGED_IN_MARKER)
             logger.info("Successfully logged in!")
-            time.sleep(3)
+            self.save_session()
             
             # Handle post-login popups
             self.handle_popups()
@@ -185,46 +501,84 @@ class EnhancedNaukriJobApplier:
             logger.error(f"Login failed: {str(e)}")
             raise
     
+    def restore_session(self) -> bool:
+        """Reuse cookies from an earlier login; returns False when the login form is needed"""
+        if not os.path.exists(COOKIES_FILE):
+            return False
+        
+        try:
+            with open(COOKIES_FILE, 'r') as f:
+                cookies = json.load(f)
+            
+            # Cookies can only be added for the domain that is currently loaded
+            self.driver.get("https://www.naukri.com")
+            for cookie in cookies:
+                self.driver.add_cookie(cookie)
+            self.driver.get("https://www.naukri.com/mnjuser/homepage")
+            
+            self.wait_for(LOGGED_IN_MARKER, timeout=5)
+            logger.info("Restored saved login session")
+            self.handle_popups()
+            return True
+        except (TimeoutException, WebDriverException, ValueError) as e:
+            logger.info(f"Saved login session is no longer valid, logging in again: {str(e)}")
+            # Only the main session's verdict counts; an extra parallel session can be refused a
+            # cookie the main session just restored, and the file is shared between them
+            if self.session is self.main_session:
+                os.remove(COOKIES_FILE)
+            return False
+    
+    def save_session(self):
+        """Save session cookies so later runs can skip the login form"""
+        try:
+            with open(COOKIES_FILE, 'w') as f:
+                json.dump(self.driver.get_cookies(), f)
+        except (OSError, WebDriverException) as e:
+            logger.warning(f"Could not save login session: {str(e)}")
+    
     def handle_popups(self):
         """Handle various popups that may appear"""
-        popup_selectors = [
-            "//button[contains(text(), 'Skip')]",
-            "//button[contains(text(), 'Later')]",
-            "//button[contains(text(), 'Not Now')]",
-            "//span[contains(@class, 'close')]",
-            ".close-popup",
-            ".modal-close"
-        ]
+        popups = (self.driver.find_elements(By.XPATH, POPUP_XPATH) +
+                  self.driver.find_elements(By.CSS_SELECTOR, POPUP_CSS))
         
-        for selector in popup_selectors:
+        for popup in popups:
             try:
-                if selector.startswith("//"):
-                    popup = self.driver.find_element(By.XPATH, selector)
-                else:
-                    popup = self.driver.find_element(By.CSS_SELECTOR, selector)
-                popup.click()
-                time.sleep(1)
-            except NoSuchElementException:
+                if popup.is_displayed():
+                    popup.click()
+                    self.wait_until_stale(popup)
+            except WebDriverException:
+                # Closing one popup can detach or cover the others
                 continue
     
     def search_jobs(self) -> List[JobDetails]:
         """Enhanced job search with better filtering"""
+        # Listing pages are static HTML, so try them without the browser first
+        try:
+            jobs = self.fetch_listings()
+        except Exception as e:
+            logger.warning(f"Error fetching listings over HTTP: {str(e)}")
+            jobs = []
+        if jobs:
+            logger.info(f"Found {len(jobs)} new jobs to apply")
+            return jobs
+        
+        logger.info("No listings parsed over HTTP, falling back to browser search")
         jobs = []
+        seen_urls = set()
         try:
             logger.info("Searching for Java backend developer jobs...")
             
             # Navigate to job search
             self.driver.get("https://www.naukri.com/jobs-in-india")
-            time.sleep(3)
-            self.handle_popups()
             
             # Search for Java backend jobs
-            search_box = self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, "suggestor-input")))
+            search_box = self.wait_for(SEARCH_BOX)
+            self.handle_popups()
             search_box.clear()
-            search_box.send_keys("backend java developer spring boot")
+            search_box.send_keys(SEARCH_KEYWORDS)
             search_box.send_keys(Keys.RETURN)
             
-            time.sleep(5)
+            self.wait_for(JOB_CARDS)
             self.handle_popups()
             
             # Apply experience filter (3+ years)
@@ -241,47 +595,99 @@ class EnhancedNaukriJobApplier:
             while page <= max_pages and len(jobs) < self.config.get('max_applications_per_run', 20):
                 logger.info(f"Scraping page {page}...")
                 page_jobs = self.extract_jobs_from_page()
-                jobs.extend(page_jobs)
+                # Results can shift between pages while browsing; keep the first copy of a job
+                jobs.extend(job for job in page_jobs if job.url not in seen_urls and not seen_urls.add(job.url))
                 
                 # Go to next page
                 if page < max_pages:
                     if self.go_to_next_page():
                         page += 1
-                        time.sleep(3)
                     else:
                         break
                 else:
                     break
             
-            # Filter out already applied jobs
-            new_jobs = [job for job in jobs if job.url not in self.applied_jobs]
-            
-            logger.info(f"Found {len(new_jobs)} new jobs to apply (out of {len(jobs)} total)")
-            return new_jobs
+            # Jobs handled by earlier runs were skipped during extraction
+            logger.info(f"Found {len(jobs)} new jobs to apply")
+            return jobs
             
         except Exception as e:
             logger.error(f"Error searching jobs: {str(e)}")
             return []
     
+    def fetch_listings(self) -> List[JobDetails]:
+        """Fetch and parse the search result pages over HTTP with the logged-in cookies"""
+        locations = self.config.get('preferred_locations')
+        location = f"-in-{locations[0].replace(' ', '-').lower()}" if locations else ""
+        urls = [
+            SEARCH_URL_TEMPLATE.format(
+                slug=SEARCH_KEYWORDS.replace(' ', '-'), location=location,
+                experience=self.config.get('experience_years', 3), page=page
+            )
+            for page in range(1, 4)  # Limit to first 3 pages
+        ]
+        max_jobs = self.config.get('max_applications_per_run', 20)
+        
+        jobs = []
+        seen_urls = set()
+        with requests.Session() as http, ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            http.headers.update({'User-Agent': USER_AGENT})
+            # One kept-alive connection per page download; transient throttling and 5xx errors are retried
+            http.mount("https://", HTTPAdapter(pool_maxsize=len(urls), max_retries=LISTING_RETRY))
+            for cookie in self.driver.get_cookies():
+                http.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'))
+            
+            # Download all pages at once; results are still consumed in page order
+            logger.info(f"Fetching {len(urls)} result pages...")
+            for response in executor.map(lambda url: self.fetch_listing_page(http, url), urls):
+                # A failed page loses only its own cards; the pages already parsed are kept
+                if response is None:
+                    continue
+                card_data = self.parse_job_cards(response.text, response.url)
+                if not card_data:
+                    break
+                for data in card_data:
+                    # Skip known jobs and jobs repeated across pages before building details
+                    url = canonical_job_url(data['url']) if data['url'] else None
+                    if url in self.known_jobs or url in seen_urls:
+                        continue
+                    seen_urls.add(url)
+                    job = self.extract_job_details(data)
+                    if job:
+                        jobs.append(job)
+                if len(jobs) >= max_jobs:
+                    break
+        return jobs
+    
+    def fetch_listing_page(self, http: requests.Session, url: str) -> Optional[requests.Response]:
+        """Download a single listing page, or None if it could not be fetched"""
+        try:
+            response = http.get(url, timeout=15)
+            response.raise_for_status()
+            return response
+        except requests.RequestException as e:
+            logger.warning(f"Error fetching listing page {url}: {str(e)}")
+            return None
+    
     def apply_experience_filter(self):
         """Apply experience filter for 3+ years"""
         try:
             # Look for experience filter options
-            exp_filters = [
-                "//span[contains(text(), '3-5 Yrs')]",
-                "//span[contains(text(), '3+ Yrs')]",
-                "//span[contains(text(), '3 Yrs')]"
-            ]
-            
-            for filter_xpath in exp_filters:
-                try:
-                    exp_filter = self.driver.find_element(By.XPATH, filter_xpath)
-                    exp_filter.click()
-                    time.sleep(2)
-                    logger.info("Applied experience filter")
-                    break
-                except NoSuchElementException:
-                    continue
+            exp_filters = self.driver.find_elements(By.XPATH, EXPERIENCE_FILTER_XPATH)
+            if exp_filters:
+                # The XPath returns document order; pick by label preference instead
+                labelled = [(exp_filter, exp_filter.text) for exp_filter in exp_filters]
+                exp_filter = next((
+                    element
+                    for label in EXPERIENCE_FILTER_LABELS
+                    for element, text in labelled
+                    if label in text
+                ), exp_filters[0])  # .text is empty for hidden spans
+                first_card = self.first_job_card()
+                exp_filter.click()
+                # Filtering re-renders the results; wait for the old cards to go away
+                self.wait_until_stale(first_card)
+                logger.info("Applied experience filter")
                     
         except Exception as e:
             logger.warning(f"Could not apply experience filter: {str(e)}")
@@ -294,18 +700,17 @@ class EnhancedNaukriJobApplier:
                 return
             
             # Look for location filter
-            location_input = self.driver.find_element(By.CSS_SELECTOR, ".location-input")
+            location_input = self.driver.find_element(*LOCATION_INPUT)
             location_input.click()
-            time.sleep(1)
             
             # Select first preferred location
             location_input.send_keys(locations[0])
-            time.sleep(2)
             
-            # Select from dropdown
-            location_option = self.driver.find_element(By.CSS_SELECTOR, ".location-dropdown .option")
+            # Select from dropdown once the suggestions render
+            location_option = self.wait_for(LOCATION_OPTION, EC.element_to_be_clickable)
+            first_card = self.first_job_card()
             location_option.click()
-            time.sleep(2)
+            self.wait_until_stale(first_card)
             
             logger.info(f"Applied location filter: {locations[0]}")
             
@@ -317,18 +722,23 @@ class EnhancedNaukriJobApplier:
         jobs = []
         try:
             # Wait for job cards to load
-            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".jobTuple")))
+            self.wait_for(JOB_CARDS)
             
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, ".jobTuple")
+            # Read every card in one round trip instead of several find_element calls per card;
+            # known jobs are dropped in the browser and never become JobDetails
+            try:
+                card_data = self.driver.execute_script(EXTRACT_JOB_CARDS_JS, list(self.known_jobs))
+            except JavascriptException:
+                # Fall back to parsing the rendered HTML locally
+                card_data = [
+                    data for data in self.parse_job_cards(self.driver.page_source, self.driver.current_url)
+                    if not data['url'] or canonical_job_url(data['url']) not in self.known_jobs
+                ]
             
-            for card in job_cards:
-                try:
-                    job = self.extract_job_details(card)
-                    if job:
-                        jobs.append(job)
-                except Exception as e:
-                    logger.warning(f"Error extracting job details: {str(e)}")
-                    continue
+            for data in card_data:
+                job = self.extract_job_details(data)
+                if job:
+                    jobs.append(job)
             
             return jobs
             
@@ -336,60 +746,49 @@ class EnhancedNaukriJobApplier:
             logger.error(f"Error extracting jobs from page: {str(e)}")
             return []
     
-    def extract_job_details(self, card) -> Optional[JobDetails]:
-        """Enhanced job details extraction"""
+    def parse_job_cards(self, html: str, base_url: str) -> List[Dict]:
+        """Parse job card fields out of listing HTML with BeautifulSoup/lxml"""
+        def text(card, selector: str) -> Optional[str]:
+            element = card.select_one(selector)
+            return element.get_text(" ", strip=True) if element else None
+        
+        cards = []
+        for card in BeautifulSoup(html, "lxml").select(".jobTuple"):
+            link = card.select_one(".title a[href]")
+            cards.append({
+                'title': text(card, ".title"),
+                'company': text(card, ".subTitle"),
+                'location': text(card, ".location"),
+                'experience': text(card, ".experience"),
+                'salary': text(card, ".salary"),
+                'url': urljoin(base_url, link['href']) if link else None,
+                'posted': text(card, ".postedDate")
+            })
+        return cards
+    
+    def extract_job_details(self, data: Dict) -> Optional[JobDetails]:
+        """Build job details from the fields scraped off a job card"""
         try:
-            # Extract basic information
-            title_elem = card.find_element(By.CSS_SELECTOR, ".title")
-            title = title_elem.text.strip()
+            # Title, company, location and link are required; skip cards missing any of them
+            if None in (data['title'], data['company'], data['location'], data['url']):
+                return None
             
-            company_elem = card.find_element(By.CSS_SELECTOR, ".subTitle")
-            company = company_elem.text.strip()
-            
-            location_elem = card.find_element(By.CSS_SELECTOR, ".location")
-            location = location_elem.text.strip()
-            
-            # Extract experience
-            try:
-                exp_elem = card.find_element(By.CSS_SELECTOR, ".experience")
-                experience = exp_elem.text.strip()
-            except NoSuchElementException:
-                experience = "Not specified"
-            
-            # Extract salary
-            try:
-                salary_elem = card.find_element(By.CSS_SELECTOR, ".salary")
-                salary = salary_elem.text.strip()
-            except NoSuchElementException:
-                salary = "Not specified"
-            
-            # Get job URL and ID
-            link_elem = card.find_element(By.CSS_SELECTOR, ".title a")
-            job_url = link_elem.get_attribute("href")
-            
-            # Extract job ID from URL
-            job_id = self.extract_job_id(job_url)
-            
-            # Extract posted date
-            try:
-                posted_elem = card.find_element(By.CSS_SELECTOR, ".postedDate")
-                posted_date = posted_elem.text.strip()
-            except NoSuchElementException:
-                posted_date = "Not specified"
+            job_url = data['url']
             
             # Check if it's an external application
             is_external, external_reason = self.is_external_application(job_url)
             
             return JobDetails(
-                title=title,
-                company=company,
-                location=location,
-                experience=experience,
-                salary=salary,
+                title=data['title'],
+                company=data['company'],
+                location=data['location'],
+                experience=data['experience'] or "Not specified",
+                salary=data['salary'] or "Not specified",
                 description="",  # Will be filled when applying
-                url=job_url,
-                job_id=job_id,
-                posted_date=posted_date,
+                # Job ID and classification look at the full link; dedup and history use the canonical one
+                url=canonical_job_url(job_url),
+                job_id=self.extract_job_id(job_url),
+                posted_date=data['posted'] or "Not specified",
                 is_external=is_external,
                 external_reason=external_reason
             )
@@ -401,16 +800,9 @@ class EnhancedNaukriJobApplier:
     def extract_job_id(self, job_url: str) -> str:
         """Extract job ID from URL"""
         try:
-            # Common patterns for job IDs in Naukri URLs
-            patterns = [
-                r'jobid=(\d+)',
-                r'jobId=(\d+)',
-                r'/job/(\d+)',
-                r'id=(\d+)'
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, job_url)
+            # Common patterns for job IDs in Naukri URLs, tried in order
+            for pattern in JOB_ID_PATTERNS:
+                match = pattern.search(job_url)
                 if match:
                     return match.group(1)
             
@@ -421,24 +813,35 @@ class EnhancedNaukriJobApplier:
             return "unknown"
     
     def is_external_application(self, job_url: str) -> tuple[bool, str]:
-        """Enhanced external application detection"""
+        """Enhanced external application detection, memoized per URL"""
+        # Classification is a pure function of the URL, and the same URL is checked
+        # at extraction, after page load and after clicking apply
+        result = self._external_cache.get(job_url)
+        if result is None:
+            result = self.classify_external_url(job_url)
+            self._external_cache[job_url] = result
+        return result
+    
+    def classify_external_url(self, job_url: str) -> tuple[bool, str]:
+        """Classify a URL as an external application, with the reason"""
         try:
             # Check URL patterns
-            for pattern in self.external_patterns:
-                if re.search(pattern, job_url, re.IGNORECASE):
-                    return True, f"URL pattern match: {pattern}"
+            match = self._external_pattern_regex.search(job_url)
+            if match:
+                pattern = self.external_patterns[int(match.lastgroup[1:])]
+                return True, f"URL pattern match: {pattern}"
             
             # Check domain
             parsed_url = urlparse(job_url)
             domain = parsed_url.netloc.lower()
             
-            if domain not in ['naukri.com', 'www.naukri.com']:
+            if domain not in NAUKRI_DOMAINS:
                 return True, f"External domain: {domain}"
             
             # Check for external domains in URL
-            for ext_domain in self.external_domains:
-                if ext_domain in job_url.lower():
-                    return True, f"External ATS domain: {ext_domain}"
+            match = self._external_domain_regex.search(job_url)
+            if match:
+                return True, f"External ATS domain: {match.group(0).lower()}"
             
             # Check for redirect parameters
             query_params = parse_qs(parsed_url.query)
@@ -454,9 +857,11 @@ class EnhancedNaukriJobApplier:
     def go_to_next_page(self) -> bool:
         """Navigate to next page of results"""
         try:
-            next_button = self.driver.find_element(By.CSS_SELECTOR, ".pagination .next")
+            next_button = self.driver.find_element(*NEXT_PAGE_BUTTON)
             if next_button.is_enabled():
+                first_card = self.first_job_card()
                 next_button.click()
+                self.wait_until_stale(first_card)
                 return True
             return False
         except NoSuchElementException:
@@ -464,32 +869,37 @@ class EnhancedNaukriJobApplier:
     
     def apply_to_job(self, job: JobDetails) -> bool:
         """Enhanced job application with better form handling"""
+        # Tabs open before this job, e.g. restored by a persistent profile, are not ours to close
+        handles_before = None
+        job_tab = None
         try:
             logger.info(f"Applying to: {job.title} at {job.company}")
             
-            # Open job in new tab
-            self.driver.execute_script(f"window.open('{job.url}', '_blank');")
-            self.driver.switch_to.window(self.driver.window_handles[-1])
-            time.sleep(3)
-            
-            # Check if it's an external application
-            if job.is_external:
-                logger.info(f"External application detected for {job.title}. Reason: {job.external_reason}")
-                self.shortlisted_jobs.append(job)
-                self.driver.close()
-                self.driver.switch_to.window(self.driver.window_handles[0])
+            if self.shortlist_if_external(job):
                 return False
             
-            # Double-check for external application after page load
+            handles_before = set(self.driver.window_handles)
+            job_tab = self.driver.current_window_handle
+            
+            # Open job in the current tab; a new tab per job costs a renderer and window switches
+            self.driver.get(job.url)
+            
+            # Wait for an apply button candidate rather than a fixed delay
+            try:
+                self.wait_for((By.XPATH, APPLY_BUTTON_XPATH))
+            except TimeoutException:
+                pass
+            
+            # The job URL was classified at extraction; only a redirect needs another check
             current_url = self.driver.current_url
-            is_external, reason = self.is_external_application(current_url)
+            is_external, reason = False, ""
+            if canonical_job_url(current_url) != job.url:
+                is_external, reason = self.is_external_application(current_url)
             if is_external:
                 job.is_external = True
                 job.external_reason = reason
                 logger.info(f"External application detected after page load: {reason}")
-                self.shortlisted_jobs.append(job)
-                self.driver.close()
-                self.driver.switch_to.window(self.driver.window_handles[0])
+                self.shortlist_job(job)
                 return False
             
             # Look for apply button with multiple strategies
@@ -498,8 +908,6 @@ class EnhancedNaukriJobApplier:
             if not apply_button:
                 logger.warning(f"No apply button found for {job.title}")
                 self.failed_applications.append(job)
-                self.driver.close()
-                self.driver.switch_to.window(self.driver.window_handles[0])
                 return False
             
             # Click apply button
@@ -508,13 +916,11 @@ class EnhancedNaukriJobApplier:
             except ElementClickInterceptedException:
                 # Try scrolling to button and clicking again
                 self.driver.execute_script("arguments[0].scrollIntoView(true);", apply_button)
-                time.sleep(1)
+                self.wait.until(EC.element_to_be_clickable(apply_button))
                 apply_button.click()
             
-            time.sleep(3)
-            
             # Handle application form
-            if self.handle_application_form(job):
+            if self.handle_application_form(job, handles_before):
                 # Mark as applied
                 job.applied = True
                 job.application_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -535,73 +941,80 @@ class EnhancedNaukriJobApplier:
             self.failed_applications.append(job)
             return False
         finally:
-            # Close current tab and switch back to main tab
-            try:
-                if len(self.driver.window_handles) > 1:
-                    self.driver.close()
-                    self.driver.switch_to.window(self.driver.window_handles[0])
-            except:
-                pass
+            # Close only the tabs opened while applying and go back to the job's tab
+            if handles_before is not None:
+                try:
+                    for handle in set(self.driver.window_handles) - handles_before:
+                        self.driver.switch_to.window(handle)
+                        self.driver.close()
+                    self.driver.switch_to.window(job_tab)
+                except WebDriverException:
+                    pass
+    
+    def shortlist_if_external(self, job: JobDetails) -> bool:
+        """Shortlist a job classified as external at extraction, without opening it"""
+        if job.is_external:
+            logger.info(f"External application detected for {job.title}. Reason: {job.external_reason}")
+            self.shortlist_job(job)
+            return True
+        return False
     
     def find_apply_button(self):
         """Find apply button using multiple strategies"""
-        apply_selectors = [
-            "//button[contains(text(), 'Apply')]",
-            "//a[contains(text(), 'Apply')]",
-            "//span[contains(text(), 'Apply')]",
-            "//div[contains(text(), 'Apply')]",
-            ".apply-button",
-            "#apply-button",
-            ".job-apply-btn",
-            ".apply-now",
-            "[data-testid='apply-button']"
-        ]
-        
-        for selector in apply_selectors:
-            try:
-                if selector.startswith("//"):
-                    button = self.driver.find_element(By.XPATH, selector)
-                else:
-                    button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                
-                if button.is_displayed() and button.is_enabled():
-                    return button
-            except NoSuchElementException:
-                continue
-        
-        return None
+        # Match and check visibility in the browser: one call instead of two per candidate
+        return self.driver.execute_script(FIRST_ACTIONABLE_JS, APPLY_BUTTON_XPATH, APPLY_BUTTON_CSS)
     
-    def handle_application_form(self, job: JobDetails) -> bool:
+    def handle_application_form(self, job: JobDetails, handles_before: Set[str] = frozenset()) -> bool:
         """Enhanced application form handling"""
         try:
-            # Wait for form to load
-            time.sleep(3)
+            # Tabs opened by the click, classified once each so later polls don't switch to them again
+            seen_tabs = set()
+            followed_tab = False
+            
+            def outcome(driver):
+                nonlocal followed_tab
+                try:
+                    for handle in set(driver.window_handles) - handles_before - seen_tabs:
+                        tab_url = self.tab_url(handle)
+                        if not tab_url or tab_url == "about:blank":
+                            continue  # Still loading; look again on the next poll
+                        seen_tabs.add(handle)
+                        if self.is_external_application(tab_url)[0]:
+                            return 'redirect', []
+                        # A Naukri-hosted apply flow in its own tab: look for the form there
+                        driver.switch_to.window(handle)
+                        followed_tab = True
+                    if self.is_redirected_externally(driver.current_url, job):
+                        return 'redirect', []
+                    forms = driver.find_elements(By.CSS_SELECTOR, APPLICATION_FORM_CSS)
+                    if forms:
+                        return 'form', forms
+                    if driver.find_elements(By.XPATH, SUCCESS_MESSAGE_XPATH):
+                        return 'success', []
+                    return None
+                except NoSuchWindowException:
+                    # The tab being checked was closed mid-application
+                    return 'closed', []
+            
+            # Wait for a form, a success message or a redirect; a timeout means none appeared.
+            # The wait returns whichever it saw, so the page is not probed again afterwards.
+            try:
+                kind, form_elements = self.short_wait.until(outcome)
+            except TimeoutException:
+                kind, form_elements = None, []
             
             # Check for external redirect after clicking apply
-            current_url = self.driver.current_url
-            if self.is_external_application(current_url)[0]:
+            if kind == 'redirect':
                 logger.info("External redirect detected after clicking apply")
                 return False
             
-            # Look for application forms
-            form_elements = self.driver.find_elements(By.CSS_SELECTOR, "form, .application-form, .job-application, .apply-form")
+            if kind == 'closed' or (kind is None and followed_tab):
+                # An apply tab that shows neither a form nor a success message isn't proof of applying
+                logger.warning(f"Apply flow for {job.title} ended without a form or confirmation")
+                return False
             
-            if not form_elements:
-                # Check if application was successful (no form means direct application)
-                success_indicators = [
-                    "//div[contains(text(), 'Application submitted')]",
-                    "//div[contains(text(), 'Applied successfully')]",
-                    "//div[contains(text(), 'Thank you for applying')]"
-                ]
-                
-                for indicator in success_indicators:
-                    try:
-                        self.driver.find_element(By.XPATH, indicator)
-                        return True
-                    except NoSuchElementException:
-                        continue
-                
-                # No form and no success message - might be direct application
+            if kind != 'form':
+                # A success message, or no form and no message - might be direct application
                 return True
             
             # Handle form fields
@@ -615,28 +1028,38 @@ class EnhancedNaukriJobApplier:
             logger.error(f"Error handling application form: {str(e)}")
             return False
     
+    def tab_url(self, handle: str) -> Optional[str]:
+        """URL of another tab, read without leaving the current one; None if that tab is gone"""
+        current = self.driver.current_window_handle
+        try:
+            self.driver.switch_to.window(handle)
+            url = self.driver.current_url
+        except WebDriverException:
+            url = None
+        # Raises NoSuchWindowException if the current tab closed meanwhile; the caller decides
+        self.driver.switch_to.window(current)
+        return url
+    
+    def is_redirected_externally(self, current_url: str, job: JobDetails) -> bool:
+        """Whether the browser has left the job page for an external application"""
+        # The job URL itself was classified at extraction
+        return canonical_job_url(current_url) != job.url and self.is_external_application(current_url)[0]
+    
     def fill_application_form(self, form) -> bool:
         """Fill application form with user data"""
         try:
-            # Handle text inputs
-            text_inputs = form.find_elements(By.CSS_SELECTOR, "input[type='text'], textarea, input[type='number']")
-            for input_field in text_inputs:
-                self.fill_text_field(input_field)
-            
-            # Handle dropdowns
-            dropdowns = form.find_elements(By.CSS_SELECTOR, "select")
-            for dropdown in dropdowns:
-                self.fill_dropdown(dropdown)
-            
-            # Handle radio buttons
-            radio_buttons = form.find_elements(By.CSS_SELECTOR, "input[type='radio']")
-            for radio in radio_buttons:
-                self.handle_radio_button(radio)
-            
-            # Handle checkboxes
-            checkboxes = form.find_elements(By.CSS_SELECTOR, "input[type='checkbox']")
-            for checkbox in checkboxes:
-                self.handle_checkbox(checkbox)
+            # Describe every field in one round trip; only fields that match are touched afterwards
+            fields = self.driver.execute_script(DESCRIBE_FORM_FIELDS_JS, form)
+            
+            for field in fields:
+                if field['tag'] == 'textarea' or (field['tag'] == 'input' and field['type'] in ('text', 'number')):
+                    self.fill_text_field(field)
+                elif field['tag'] == 'select':
+                    self.fill_dropdown(field)
+                elif field['type'] == 'radio':
+                    self.handle_radio_button(field)
+                elif field['type'] == 'checkbox':
+                    self.handle_checkbox(field)
             
             # Submit form
             return self.submit_form(form)
@@ -645,86 +1068,74 @@ class EnhancedNaukriJobApplier:
             logger.error(f"Error filling form: {str(e)}")
             return False
     
-    def fill_text_field(self, input_field):
+    def fill_text_field(self, field: Dict):
         """Fill text input field based on field type"""
         try:
-            field_name = (input_field.get_attribute("name") or 
-                         input_field.get_attribute("id") or 
-                         input_field.get_attribute("placeholder") or "").lower()
-            
-            if "experience" in field_name and "years" in field_name:
-                input_field.clear()
-                input_field.send_keys(str(self.config.get('experience_years', 3)))
-            elif "notice" in field_name:
-                input_field.clear()
-                input_field.send_keys(self.config.get('notice_period', '30'))
-            elif "expected" in field_name and "salary" in field_name:
-                input_field.clear()
-                input_field.send_keys(self.config.get('expected_salary', '800000'))
-            elif "current" in field_name and "salary" in field_name:
-                input_field.clear()
-                input_field.send_keys(self.config.get('current_salary', '600000'))
-            elif "mobile" in field_name or "phone" in field_name:
-                input_field.clear()
-                input_field.send_keys(self.config.get('mobile', ''))
-            elif "email" in field_name:
-                input_field.clear()
-                input_field.send_keys(self.config.get('email', ''))
+            field_name = (field['name'] or field['id'] or field['placeholder']).lower()
+            
+            value = self.text_field_value(field_name)
+            if value is not None:
+                field['element'].clear()
+                field['element'].send_keys(value)
                 
         except Exception as e:
             logger.warning(f"Error filling text field: {str(e)}")
     
-    def fill_dropdown(self, dropdown):
+    def text_field_value(self, field_name: str) -> Optional[str]:
+        """Return the configured value for a text field name, or None if it is not recognised"""
+        for keywords, config_key, default in TEXT_FIELD_MAP:
+            if all(keyword in field_name for keyword in keywords):
+                return str(self.config.get(config_key, default))
+        return None
+    
+    def fill_dropdown(self, field: Dict):
         """Fill dropdown field"""
         try:
-            dropdown_name = (dropdown.get_attribute("name") or 
-                           dropdown.get_attribute("id") or "").lower()
-            
-            select = Select(dropdown)
+            dropdown_name = (field['name'] or field['id']).lower()
             
+            option_to_select = None
             if "experience" in dropdown_name:
                 # Select appropriate experience option
-                for option in select.options:
-                    option_text = option.text.lower()
-                    if "3" in option_text and ("year" in option_text or "yr" in option_text):
-                        select.select_by_visible_text(option.text)
+                for option_text in field['options']:
+                    option_lower = option_text.lower()
+                    if "3" in option_lower and ("year" in option_lower or "yr" in option_lower):
+                        option_to_select = option_text
                         break
             elif "notice" in dropdown_name:
                 # Select notice period
-                for option in select.options:
-                    if "30" in option.text or "1 month" in option.text.lower():
-                        select.select_by_visible_text(option.text)
+                for option_text in field['options']:
+                    if "30" in option_text or "1 month" in option_text.lower():
+                        option_to_select = option_text
                         break
+            
+            if option_to_select is not None:
+                Select(field['element']).select_by_visible_text(option_to_select)
                         
         except Exception as e:
             logger.warning(f"Error filling dropdown: {str(e)}")
     
-    def handle_radio_button(self, radio):
+    def handle_radio_button(self, field: Dict):
         """Handle radio button selection"""
         try:
-            radio_name = (radio.get_attribute("name") or 
-                         radio.get_attribute("id") or "").lower()
-            
-            if "experience" in radio_name and "3" in radio.get_attribute("value", ""):
-                if not radio.is_selected():
-                    radio.click()
-            elif "notice" in radio_name and "30" in radio.get_attribute("value", ""):
-                if not radio.is_selected():
-                    radio.click()
+            radio_name = (field['name'] or field['id']).lower()
+            
+            if field['checked']:
+                return
+            if ("experience" in radio_name and "3" in field['value']) or \
+                    ("notice" in radio_name and "30" in field['value']):
+                field['element'].click()
                     
         except Exception as e:
             logger.warning(f"Error handling radio button: {str(e)}")
     
-    def handle_checkbox(self, checkbox):
+    def handle_checkbox(self, field: Dict):
         """Handle checkbox selection"""
         try:
-            checkbox_name = (checkbox.get_attribute("name") or 
-                           checkbox.get_attribute("id") or "").lower()
+            checkbox_name = (field['name'] or field['id']).lower()
             
             # Select relevant checkboxes (e.g., terms and conditions)
-            if "terms" in checkbox_name or "agree" in checkbox_name:
-                if not checkbox.is_selected():
-                    checkbox.click()
+            if ("terms" in checkbox_name or "agree" in checkbox_name) and not field['checked']:
+                field['element'].click()
                     
         except Exception as e:
             logger.warning(f"Error handling checkbox: {str(e)}")
@@ -732,29 +1143,11 @@ class EnhancedNaukriJobApplier:
     def submit_form(self, form) -> bool:
         """Submit application form"""
         try:
-            # Look for submit buttons
-            submit_selectors = [
-                "button[type='submit']",
-                "input[type='submit']",
-                ".submit-btn",
-                ".apply-submit",
-                "//button[contains(text(), 'Submit')]",
-                "//button[contains(text(), 'Apply')]"
-            ]
-            
-            for selector in submit_selectors:
-                try:
-                    if selector.startswith("//"):
-                        submit_btn = form.find_element(By.XPATH, selector)
-                    else:
-                        submit_btn = form.find_element(By.CSS_SELECTOR, selector)
-                    
-                    if submit_btn.is_displayed() and submit_btn.is_enabled():
-                        submit_btn.click()
-                        time.sleep(3)
-                        return True
-                except NoSuchElementException:
-                    continue
+            # Look for submit buttons inside this form
+            submit_btn = self.driver.execute_script(FIRST_ACTIONABLE_JS, SUBMIT_BUTTON_XPATH, SUBMIT_BUTTON_CSS, form)
+            if submit_btn:
+                submit_btn.click()
+                self.wait_until_stale(submit_btn)
             
             return True  # No submit button found, might be auto-submit
             
@@ -762,30 +1155,37 @@ class EnhancedNaukriJobApplier:
             logger.error(f"Error submitting form: {str(e)}")
             return False
     
+    def shortlist_job(self, job: JobDetails):
+        """Record an external job for manual application as soon as it is found"""
+        row = [job.title, job.company, job.location, job.experience, job.salary, job.url, job.job_id,
+               job.external_reason]
+        with self._save_lock:
+            self.shortlisted_jobs.append(job)
+            # Written and flushed per job so a crash mid-run keeps every job shortlisted so far
+            if self._shortlist_csv is None:
+                os.makedirs('output', exist_ok=True)
+                self._shortlist_csv = open(f"output/shortlisted_jobs_{self.run_timestamp}.csv", 'w',
+                                           newline='', encoding='utf-8')
+                self._shortlist_writer = csv.writer(self._shortlist_csv)
+                self._shortlist_writer.writerow(SHORTLISTED_JOBS_HEADER)
+            self._shortlist_writer.writerow(row)
+            self._shortlist_csv.flush()
+            
+            # Remember it so later runs don't shortlist the same job again
+            with self.db:
+                self.db.execute(
+                    "INSERT OR IGNORE INTO shortlisted VALUES (?, ?, ?, ?)",
+                    (job.url, job.job_id, job.external_reason, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+                )
+    
     def save_shortlisted_jobs(self):
-        """Save shortlisted jobs to CSV for manual application"""
-        if not self.shortlisted_jobs:
-            return
-        
-        os.makedirs('output', exist_ok=True)
-        filename = f"output/shortlisted_jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Title', 'Company', 'Location', 'Experience', 'Salary', 'URL', 'Job ID', 'External Reason'])
-            
-            for job in self.shortlisted_jobs:
-                writer.writerow([
-                    job.title,
-                    job.company,
-                    job.location,
-                    job.experience,
-                    job.salary,
-                    job.url,
-                    job.job_id,
-                    job.external_reason
-                ])
+        """Close the shortlisted jobs CSV written during the run"""
+        with self._save_lock:
+            if self._shortlist_csv is None or self._shortlist_csv.closed:
+                return
+            self._shortlist_csv.close()
         
-        logger.info(f"Shortlisted {len(self.shortlisted_jobs)} jobs saved to {filename}")
+        logger.info(f"Shortlisted {len(self.shortlisted_jobs)} jobs saved to {self._shortlist_csv.name}")
     
     def save_failed_applications(self):
         """Save failed applications for review"""
@@ -793,30 +1193,25 @@ class EnhancedNaukriJobApplier:
             return
         
         os.makedirs('output', exist_ok=True)
-        filename = f"output/failed_applications_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        filename = f"output/failed_applications_{self.run_timestamp}.csv"
         with open(filename, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             writer.writerow(['Title', 'Company', 'Location', 'URL', 'Job ID', 'Status', 'Error'])
-            
-            for job in self.failed_applications:
-                writer.writerow([
-                    job.title,
-                    job.company,
-                    job.location,
-                    job.url,
-                    job.job_id,
-                    job.application_status,
-                    job.external_reason if hasattr(job, 'external_reason') else 'Unknown'
-                ])
+            writer.writerows(
+                [job.title, job.company, job.location, job.url, job.job_id, job.application_status,
+                 job.external_reason]
+                for job in self.failed_applications
+            )
         
         logger.info(f"Failed applications saved to {filename}")
     
     def generate_report(self):
         """Generate application report"""
-        total_jobs = len(self.applied_jobs) + len(self.shortlisted_jobs) + len(self.failed_applications)
-        applied_count = len([job for job in self.applied_jobs if job])
+        applied_count = sum(1 for job in self.applied_jobs if job)
         shortlisted_count = len(self.shortlisted_jobs)
         failed_count = len(self.failed_applications)
+        total_jobs = applied_count + shortlisted_count + failed_count
+        success_rate = applied_count / total_jobs * 100 if total_jobs else 0.0
         
         report = f"""
         📊 Application Report - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
@@ -825,7 +1220,7 @@ class EnhancedNaukriJobApplier:
         Successfully Applied: {applied_count}
         Shortlisted (External): {shortlisted_count}
         Failed Applications: {failed_count}
-        Success Rate: {(applied_count/total_jobs*100):.1f}% (excluding shortlisted)
+        Success Rate: {success_rate:.1f}% (excluding shortlisted)
         ================================================
         """
         
@@ -833,9 +1228,49 @@ class EnhancedNaukriJobApplier:
         
         # Save report to file
         os.makedirs('output', exist_ok=True)
-        with open(f"output/application_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt", 'w') as f:
+        with open(f"output/application_report_{self.run_timestamp}.txt", 'w') as f:
             f.write(report)
     
+    def apply_to_jobs_parallel(self, jobs: List[JobDetails], sessions: int) -> int:
+        """Apply to jobs concurrently, one worker thread per logged-in browser session"""
+        extra_sessions = []
+        try:
+            pool_sessions = [self.main_session]
+            for _ in range(sessions - 1):
+                session = self.create_session()
+                extra_sessions.append(session)
+                try:
+                    with self.use_session(session):
+                        self.login()
+                except Exception:
+                    logger.warning("Could not log in additional browser session, continuing with fewer")
+                    continue
+                pool_sessions.append(session)
+            
+            pool = BrowserPool(pool_sessions)
+            delay = self.config.get('delay_between_applications', 5)
+            logger.info(f"Applying with {pool.size} parallel browser sessions")
+            
+            def worker(job: JobDetails) -> bool:
+                with pool.session() as session, self.use_session(session):
+                    # Keep the configured delay between applications per session, but only
+                    # wait for what is left of it and never after a session's last job
+                    time.sleep(max(0.0, session.ready_at - time.monotonic()))
+                    logger.info(f"Processing job: {job.title}")
+                    try:
+                        return self.apply_to_job(job)
+                    finally:
+                        session.ready_at = time.monotonic() + delay
+            
+            with ThreadPoolExecutor(max_workers=pool.size) as executor:
+                return sum(executor.map(worker, jobs))
+        finally:
+            for session in extra_sessions:
+                try:
+                    session.driver.quit()
+                except Exception:
+                    pass
+    
     def run(self):
         """Main execution method"""
         try:
@@ -851,22 +1286,27 @@ class EnhancedNaukriJobApplier:
                 logger.info("No new jobs found to apply")
                 return
             
+            # Shortlist known external jobs up front; they never load a page, so the
+            # delay between applications only has to separate the remaining jobs
+            jobs = [job for job in jobs if not self.shortlist_if_external(job)]
+            
             # Apply to jobs
-            applied_count = 0
-            for i, job in enumerate(jobs, 1):
-                logger.info(f"Processing job {i}/{len(jobs)}: {job.title}")
-                
-                if self.apply_to_job(job):
-                    applied_count += 1
-                
-                # Add delay between applications
+            sessions = min(self.config.get('parallel_sessions', 1), len(jobs))
+            if sessions > 1:
+                applied_count = self.apply_to_jobs_parallel(jobs, sessions)
+            else:
+                applied_count = 0
                 delay = self.config.get('delay_between_applications', 5)
-                if i < len(jobs):  # Don't delay after last job
-                    time.sleep(delay)
+                for i, job in enumerate(jobs, 1):
+                    logger.info(f"Processing job {i}/{len(jobs)}: {job.title}")
+                    
+                    if self.apply_to_job(job):
+                        applied_count += 1
+                    
+                    # Add delay between applications
+                    if i < len(jobs):  # Don't delay after last job
+                        time.sleep(delay)
             
-            # Save results
-            self.save_shortlisted_jobs()
-            self.save_failed_applications()
             self.generate_report()
             
             logger.info(f"Application process completed. Applied to {applied_count} jobs.")
@@ -876,8 +1316,14 @@ class EnhancedNaukriJobApplier:
         except Exception as e:
             logger.error(f"Error in main execution: {str(e)}")
         finally:
-            if self.driver:
-                self.driver.quit()
+            # Save results, including whatever was collected before a crash or Ctrl+C
+            self.save_shortlisted_jobs()
+            self.save_failed_applications()
+            if self.main_session:
+                self.main_session.driver.quit()
+            self.close_applied_jobs_csv()
+            if self.db:
+                self.db.close()
 
 def main():
     """Main function"""
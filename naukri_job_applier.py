@@ -4,34 +4,125 @@ Naukri.com Job Application Automation Script
 Automatically applies to backend Java developer jobs with 3+ years experience
 """
 
+import os
 import time
 import json
 import csv
 import logging
+import logging.handlers
+import queue
+import re
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.etree
+import lxml.html
 from urllib.parse import urljoin, urlparse
 
-# Configure logging
+# Configure logging; file records are buffered and written in batches (immediately for warnings
+# and errors) instead of flushing the file on every message. logging drains the buffer at exit.
+# The console stays unbuffered so progress shows up as it happens.
+_log_formatter = logging.Formatter('%(asctime)s - %(threadName)s - %(levelname)s - %(message)s')
+_log_file = logging.FileHandler('naukri_applications.log')
+_log_console = logging.StreamHandler()
+for _handler in (_log_file, _log_console):
+    _handler.setFormatter(_log_formatter)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('naukri_applications.log'),
-        logging.StreamHandler()
+        logging.handlers.MemoryHandler(capacity=20, flushLevel=logging.WARNING, target=_log_file),
+        _log_console,
     ]
 )
 logger = logging.getLogger(__name__)
 
+NAUKRI_BASE_URL = "https://www.naukri.com/"
+COOKIES_FILE = "naukri_cookies.json"
+APPLY_API_HEADERS = {"appid": "121", "systemid": "Naukri"}
+SEARCH_URL_TEMPLATE = NAUKRI_BASE_URL + "{slug}-jobs?experience={experience}"
+LISTING_RETRY = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+LISTING_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+}
+
+# Third-party analytics/ad hosts and heavy static assets aborted at the network layer
+BLOCKED_URL_PATTERNS = [
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*hotjar.com*", "*clarity.ms*", "*criteo.com*",
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.woff", "*.woff2", "*.ttf",
+    "*.ico", "*.mp4", "*.webm",
+]
+
+# contains(., ...) also sees badge text nested in child nodes
+_QUICK_APPLY = lxml.etree.XPath(".//*[contains(@class, 'naukri-apply') or contains(., 'Easy Apply')]")
+
+# Locators are built once at import time instead of on every lookup
+USERNAME_FIELD = (By.ID, "usernameField")
+PASSWORD_FIELD = (By.ID, "passwordField")
+LOGIN_BUTTON = (By.XPATH, "//button[contains(text(), 'Login')]")
+LOGGED_IN_MARKER = (By.CLASS_NAME, "user-name")
+SEARCH_BOX = (By.CLASS_NAME, "suggestor-input")
+EXPERIENCE_FILTER = (By.XPATH, "//span[contains(text(), '3-5 Yrs') or contains(text(), '3+ Yrs')]")
+JOB_CARDS = (By.CSS_SELECTOR, ".jobTuple")
+APPLY_BUTTON = (By.XPATH, "//button[contains(text(), 'Apply')] | //a[contains(text(), 'Apply')] | "
+                          "//span[contains(text(), 'Apply')] | //*[contains(@class, 'apply-button')] | "
+                          "//*[@id='apply-button']")
+APPLICATION_FORMS = (By.CSS_SELECTOR, "form, .application-form, .job-application")
+SUCCESS_MESSAGE = (By.XPATH, "//*[contains(text(), 'Application submitted') or "
+                             "contains(text(), 'Applied successfully') or contains(text(), 'Thank you for applying')]")
+# Text field dispatch table: (keywords that must all appear in the field name, config key, default),
+# checked in order so the first match wins
+TEXT_FIELD_MAP = [
+    (("experience", "years"), 'experience_years', 3),
+    (("notice",), 'notice_period', '30'),
+    (("expected", "salary"), 'expected_salary', '800000'),
+    (("current", "salary"), 'current_salary', '600000'),
+]
+
+# Describes the text inputs, textareas and dropdowns of the form in arguments[0] in one round trip;
+# the element references come back as WebElements
+DESCRIBE_FORM_FIELDS_JS = """
+return Array.from(arguments[0].querySelectorAll("input[type='text'], textarea, select")).map(el => ({
+    element: el,
+    tag: el.tagName.toLowerCase(),
+    name: (el.name || el.id || '').toLowerCase(),
+    options: el.tagName === 'SELECT' ? Array.from(el.options).map(option => option.text) : []
+}));
+"""
+FORM_SUBMIT_BUTTONS = (By.CSS_SELECTOR, "button[type='submit'], input[type='submit'], .submit-btn")
+
+# Tracking query strings and fragments make the same job look like different URLs
+_TRACKING_RE = re.compile(r"[?#].*$")
+# External redirect indicators, matched in one case-insensitive scan of the URL
+_EXTERNAL_URL_RE = re.compile(r"redirect|external|apply|careers|jobs", re.IGNORECASE)
+
+
+def canonical_job_url(url: str) -> str:
+    """Strip tracking parameters so a job has a single URL for dedup and history"""
+    return _TRACKING_RE.sub("", url).rstrip("/")
+
+
+@lru_cache(maxsize=None)
+def _class_xpath(class_name: str, suffix: str = "") -> lxml.etree.XPath:
+    """Compiled relative XPath matching descendants that carry the given CSS class"""
+    # Compiled once per selector and reused for every card and page
+    return lxml.etree.XPath(f".//*[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]{suffix}")
+
+
 @dataclass
 class JobDetails:
     """Data class to store job information"""
@@ -42,18 +133,63 @@ class JobDetails:
     salary: str
     description: str
     url: str
+    job_id: str = ""
     is_external: bool = False
+    quick_apply: bool = True
     applied: bool = False
     application_date: Optional[str] = None
 
+class ShortlistSink:
+    """Appends shortlisted jobs to CSV as they are found, so a crash loses at most a few rows"""
+    
+    HEADER = ['Title', 'Company', 'Location', 'Experience', 'Salary', 'URL', 'Reason']
+    
+    def __init__(self, flush_every: int = 10):
+        self.flush_every = flush_every
+        self.filename = None
+        self.count = 0
+        self._file = None
+        self._writer = None
+        self._lock = threading.Lock()
+    
+    def add(self, job: JobDetails):
+        """Write a shortlisted job, opening the CSV on first use"""
+        with self._lock:
+            if self._file is None:
+                self.filename = f"shortlisted_jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+                self._file = open(self.filename, 'w', newline='', encoding='utf-8')
+                self._writer = csv.writer(self._file)
+                self._writer.writerow(self.HEADER)
+            
+            self._writer.writerow([
+                job.title, job.company, job.location, job.experience, job.salary, job.url,
+                'External application or requires manual review'
+            ])
+            self.count += 1
+            # Flush in small batches to keep syscalls low while bounding loss on a crash
+            if self.count % self.flush_every == 0:
+                self._file.flush()
+    
+    def close(self):
+        """Flush and close the CSV if anything was shortlisted"""
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.close()
+            self._file = None
+            logger.info(f"Shortlisted {self.count} jobs saved to {self.filename}")
+
 class NaukriJobApplier:
     """Main class for automating Naukri.com job applications"""
     
     def __init__(self, config_file: str = "config.json"):
         self.config = self.load_config(config_file)
+        self.search_urls = self.build_search_urls()
         self.driver = None
         self.applied_jobs = self.load_applied_jobs()
-        self.shortlisted_jobs = []
+        self.shortlist = ShortlistSink()
+        self._csv_lock = threading.Lock()
+        self.open_applied_jobs_csv()
         self.setup_driver()
     
     def load_config(self, config_file: str) -> Dict:
@@ -74,45 +210,115 @@ class NaukriJobApplier:
                 next(reader, None)  # Skip header
                 for row in reader:
                     if row:
-                        applied_jobs.add(row[0])  # Job URL
+                        applied_jobs.add(canonical_job_url(row[0]))  # Job URL
         except FileNotFoundError:
             logger.info("No previous applications found. Starting fresh.")
         return applied_jobs
     
+    def open_applied_jobs_csv(self):
+        """Open applied_jobs.csv once for the whole run"""
+        self._applied_csv = open('applied_jobs.csv', 'a', newline='')
+        self._applied_writer = csv.writer(self._applied_csv)
+        # Check if file is empty to write header
+        if self._applied_csv.tell() == 0:
+            self._applied_writer.writerow(['URL', 'Title', 'Company', 'Applied Date'])
+    
+    def close_applied_jobs_csv(self):
+        """Flush and close applied_jobs.csv"""
+        with self._csv_lock:
+            if not self._applied_csv.closed:
+                self._applied_csv.close()
+    
     def save_applied_job(self, job_url: str, job_title: str, company: str):
         """Save applied job to CSV"""
-        with open('applied_jobs.csv', 'a', newline='') as f:
-            writer = csv.writer(f)
-            # Check if file is empty to write header
-            if f.tell() == 0:
-                writer.writerow(['URL', 'Title', 'Company', 'Applied Date'])
-            writer.writerow([job_url, job_title, company, datetime.now().strftime('%Y-%m-%d %H:%M:%S')])
+        with self._csv_lock:
+            self._applied_writer.writerow([job_url, job_title, company, datetime.now().strftime('%Y-%m-%d %H:%M:%S')])
+            # This file is the only record of past applications; flush so a crash can't cause re-applying
+            self._applied_csv.flush()
     
     def setup_driver(self):
-        """Setup Chrome WebDriver with appropriate options"""
+        """Setup the main Chrome WebDriver session"""
+        self.driver = self.create_driver(self.config.get('chrome_profile_dir'),
+                                         self.config.get('chrome_debugger_address'))
+        self.wait = self.driver.wait
+        self.short_wait = self.driver.short_wait
+    
+    def create_driver(self, profile_dir: Optional[str] = None,
+                      debugger_address: Optional[str] = None) -> webdriver.Chrome:
+        """Create a Chrome WebDriver, or attach to a running Chrome at debugger_address"""
+        if debugger_address:
+            # Reuse a Chrome kept running with --remote-debugging-port: no browser cold start,
+            # and its cache and cookies stay warm. Launch options can't apply to it.
+            chrome_options = Options()
+            chrome_options.add_experimental_option("debuggerAddress", debugger_address)
+            chrome_options.page_load_strategy = "eager"
+        else:
+            chrome_options = self.launch_options(profile_dir)
+        
+        driver = webdriver.Chrome(options=chrome_options)
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        
+        # Block trackers for every later driver.get() in this session
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except WebDriverException as e:
+            logger.warning(f"Could not enable network request blocking: {str(e)}")
+        
+        # Each session carries its own waits, one per timeout bucket, reused for every lookup.
+        # Polling faster than the 0.5s default notices ready elements sooner.
+        driver.short_wait = WebDriverWait(driver, 3, poll_frequency=0.1)
+        driver.wait = WebDriverWait(driver, 10, poll_frequency=0.2)
+        driver.long_wait = WebDriverWait(driver, 30, poll_frequency=0.3)
+        return driver
+    
+    def launch_options(self, profile_dir: Optional[str] = None) -> Options:
+        """Chrome options for launching a new browser"""
         chrome_options = Options()
+        if profile_dir:
+            # A persistent profile keeps the HTTP cache and cookies warm across runs
+            chrome_options.add_argument(f"--user-data-dir={os.path.abspath(os.path.expanduser(profile_dir))}")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
-        # Uncomment the next line if you want to run headless
-        # chrome_options.add_argument("--headless")
+        # Skip downloading resources that are irrelevant to finding the Apply button
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+            "profile.managed_default_content_settings.plugins": 2,
+            "profile.managed_default_content_settings.popups": 2,
+            "profile.managed_default_content_settings.notifications": 2,
+        })
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-sync")
+        chrome_options.add_argument("--disable-features=Translate,MediaRouter")
+        # Return from driver.get() at DOMContentLoaded; explicit waits cover the rest
+        chrome_options.page_load_strategy = "eager"
         
-        self.driver = webdriver.Chrome(options=chrome_options)
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        self.wait = WebDriverWait(self.driver, 10)
+        # Set "headless": true in config.json to run without a browser window
+        if self.config.get('headless'):
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument("--window-size=1920,1080")
+        return chrome_options
     
-    def login(self):
-        """Login to Naukri.com"""
+    def login(self, driver: Optional[webdriver.Chrome] = None):
+        """Login to Naukri.com, reusing the saved session when it is still valid"""
+        driver = driver or self.driver
+        if self.restore_session(driver):
+            return
+        
         try:
             logger.info("Logging into Naukri.com...")
-            self.driver.get("https://www.naukri.com/nlogin/login")
+            driver.get("https://www.naukri.com/nlogin/login")
             
             # Wait for login form
-            email_field = self.wait.until(EC.presence_of_element_located((By.ID, "usernameField")))
-            password_field = self.driver.find_element(By.ID, "passwordField")
+            email_field = driver.wait.until(EC.presence_of_element_located(USERNAME_FIELD))
+            password_field = driver.find_element(*PASSWORD_FIELD)
             
             # Enter credentials
             email_field.clear()
@@ -121,13 +327,13 @@ class NaukriJobApplier:
             password_field.send_keys(self.config['password'])
             
             # Click login button
-            login_button = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Login')]")
+            login_button = driver.find_element(*LOGIN_BUTTON)
             login_button.click()
             
             # Wait for successful login
-            self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, "user-name")))
+            driver.long_wait.until(EC.presence_of_element_located(LOGGED_IN_MARKER))
             logger.info("Successfully logged in!")
-            time.sleep(3)
+            self.save_session(driver)
             
         except TimeoutException:
             logger.error("Login failed - timeout waiting for elements")
@@ -136,43 +342,156 @@ class NaukriJobApplier:
             logger.error(f"Login failed: {str(e)}")
             raise
     
+    def build_search_urls(self) -> List[str]:
+        """Build the listing URL for every configured job keyword"""
+        keywords = self.config.get('job_keywords') or ["backend java developer spring boot"]
+        experience = self.config.get('experience_years', 3)
+        return [
+            SEARCH_URL_TEMPLATE.format(slug=keyword.replace(' ', '-').lower(), experience=experience)
+            for keyword in keywords
+        ]
+    
+    def fetch_listings(self) -> List[JobDetails]:
+        """Fetch and parse keyword listing pages over plain HTTP, without the browser"""
+        # Keyword searches overlap heavily; keep only the first listing of each job
+        jobs = []
+        seen_urls = set()
+        workers = min(10, len(self.search_urls))
+        with requests.Session() as session, ThreadPoolExecutor(max_workers=workers) as executor:
+            # One kept-alive connection per worker; transient throttling and 5xx errors are retried
+            session.mount("https://", HTTPAdapter(pool_maxsize=workers, max_retries=LISTING_RETRY))
+            futures = [executor.submit(self.fetch_listing_page, session, url) for url in self.search_urls]
+            # Parse each page as soon as it arrives while the remaining downloads continue
+            for future in as_completed(futures):
+                page = future.result()
+                if not page:
+                    continue
+                tree = lxml.html.fromstring(page)
+                for card in _class_xpath('jobTuple')(tree):
+                    job = self.extract_listing_details(card)
+                    if job and job.url not in seen_urls:
+                        seen_urls.add(job.url)
+                        jobs.append(job)
+        return jobs
+    
+    def fetch_listing_page(self, session: requests.Session, url: str) -> Optional[str]:
+        """Download a single listing page"""
+        try:
+            response = session.get(url, headers=LISTING_HEADERS, timeout=15)
+            response.raise_for_status()
+            return response.text
+        except requests.RequestException as e:
+            logger.warning(f"Error fetching listing page {url}: {str(e)}")
+            return None
+    
+    def extract_listing_details(self, card) -> Optional[JobDetails]:
+        """Extract job details from a job card parsed out of listing HTML"""
+        def text(class_name: str, default: str = "Not specified") -> str:
+            elements = _class_xpath(class_name)(card)
+            return elements[0].text_content().strip() if elements else default
+        
+        links = _class_xpath('title', "/descendant-or-self::a/@href")(card)
+        if not links:
+            return None
+        job_url = urljoin(NAUKRI_BASE_URL, links[0])
+        
+        return JobDetails(
+            title=text('title', ""),
+            company=text('subTitle', ""),
+            location=text('location', ""),
+            experience=text('experience'),
+            salary=text('salary'),
+            description="",  # Will be filled when applying
+            url=canonical_job_url(job_url),
+            job_id=card.get('data-job-id', ""),
+            is_external=self.is_external_application(job_url),
+            quick_apply=bool(_QUICK_APPLY(card))
+        )
+    
+    def restore_session(self, driver: webdriver.Chrome) -> bool:
+        """Restore saved session cookies; returns False when a full login is needed"""
+        if not os.path.exists(COOKIES_FILE):
+            return False
+        
+        try:
+            with open(COOKIES_FILE, 'r') as f:
+                cookies = json.load(f)
+            
+            # Cookies can only be set for the domain that is currently loaded
+            driver.get(NAUKRI_BASE_URL)
+            for cookie in cookies:
+                driver.add_cookie(cookie)
+            driver.refresh()
+            
+            driver.short_wait.until(EC.presence_of_element_located(LOGGED_IN_MARKER))
+            logger.info("Restored saved login session")
+            return True
+        except (TimeoutException, WebDriverException, ValueError) as e:
+            logger.info(f"Saved login session is no longer valid, logging in again: {str(e)}")
+            # Only the main session's verdict counts; an extra parallel session can be refused a
+            # cookie the main session just restored, and the file is shared between them
+            if driver is self.driver:
+                os.remove(COOKIES_FILE)
+            return False
+    
+    def save_session(self, driver: webdriver.Chrome):
+        """Save session cookies so the next run can skip the login form"""
+        try:
+            with open(COOKIES_FILE, 'w') as f:
+                json.dump(driver.get_cookies(), f)
+        except (OSError, WebDriverException) as e:
+            logger.warning(f"Could not save login session: {str(e)}")
+    
     def search_jobs(self) -> List[JobDetails]:
         """Search for Java backend developer jobs"""
-        jobs = []
+        # Listing pages are static HTML, so try them without the browser first
+        try:
+            jobs = [job for job in self.fetch_listings() if job.url not in self.applied_jobs][:20]
+        except Exception as e:
+            logger.warning(f"Error fetching listings over HTTP: {str(e)}")
+            jobs = []
+        if jobs:
+            logger.info(f"Found {len(jobs)} new jobs to apply")
+            return jobs
+        
+        logger.info("No listings parsed over HTTP, falling back to browser search")
+        seen_urls = set()
         try:
             logger.info("Searching for Java backend developer jobs...")
             
             # Navigate to job search
             self.driver.get("https://www.naukri.com/jobs-in-india")
-            time.sleep(3)
             
             # Search for Java backend jobs
-            search_box = self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, "suggestor-input")))
+            search_box = self.wait.until(EC.presence_of_element_located(SEARCH_BOX))
             search_box.clear()
             search_box.send_keys("backend java developer spring boot")
             search_box.send_keys(Keys.RETURN)
             
-            time.sleep(3)
+            # Wait for the result cards instead of sleeping for a fixed time
+            job_cards = self.wait.until(EC.presence_of_all_elements_located(JOB_CARDS))
             
             # Apply experience filter (3+ years)
-            try:
-                exp_filter = self.driver.find_element(By.XPATH, "//span[contains(text(), '3-5 Yrs') or contains(text(), '3+ Yrs')]")
-                exp_filter.click()
-                time.sleep(2)
-            except NoSuchElementException:
+            exp_filters = self.driver.find_elements(*EXPERIENCE_FILTER)
+            if exp_filters:
+                exp_filters[0].click()
+                # Filtering re-renders the result list; wait for the old cards to go stale
+                try:
+                    self.short_wait.until(EC.staleness_of(job_cards[0]))
+                except TimeoutException:
+                    pass
+                job_cards = self.wait.until(EC.presence_of_all_elements_located(JOB_CARDS))
+            else:
                 logger.warning("Experience filter not found, continuing without filter")
             
-            # Get job listings
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, ".jobTuple")
-            
-            for card in job_cards[:20]:  # Limit to first 20 jobs
-                try:
-                    job = self.extract_job_details(card)
-                    if job and job.url not in self.applied_jobs:
-                        jobs.append(job)
-                except Exception as e:
-                    logger.warning(f"Error extracting job details: {str(e)}")
-                    continue
+            # Parse the rendered results locally: one page_source round trip instead of
+            # several find_element calls per card
+            tree = lxml.html.fromstring(self.driver.page_source)
+            for card in _class_xpath('jobTuple')(tree)[:20]:  # Limit to first 20 jobs
+                job = self.extract_listing_details(card)
+                if job and job.url not in self.applied_jobs and job.url not in seen_urls:
+                    seen_urls.add(job.url)
+                    jobs.append(job)
             
             logger.info(f"Found {len(jobs)} new jobs to apply")
             return jobs
@@ -181,63 +500,9 @@ class NaukriJobApplier:
             logger.error(f"Error searching jobs: {str(e)}")
             return []
     
-    def extract_job_details(self, card) -> Optional[JobDetails]:
-        """Extract job details from job card element"""
-        try:
-            # Extract basic information
-            title_elem = card.find_element(By.CSS_SELECTOR, ".title")
-            title = title_elem.text.strip()
-            
-            company_elem = card.find_element(By.CSS_SELECTOR, ".subTitle")
-            company = company_elem.text.strip()
-            
-            location_elem = card.find_element(By.CSS_SELECTOR, ".location")
-            location = location_elem.text.strip()
-            
-            # Extract experience
-            try:
-                exp_elem = card.find_element(By.CSS_SELECTOR, ".experience")
-                experience = exp_elem.text.strip()
-            except NoSuchElementException:
-                experience = "Not specified"
-            
-            # Extract salary
-            try:
-                salary_elem = card.find_element(By.CSS_SELECTOR, ".salary")
-                salary = salary_elem.text.strip()
-            except NoSuchElementException:
-                salary = "Not specified"
-            
-            # Get job URL
-            link_elem = card.find_element(By.CSS_SELECTOR, ".title a")
-            job_url = link_elem.get_attribute("href")
-            
-            # Check if it's an external application
-            is_external = self.is_external_application(job_url)
-            
-            return JobDetails(
-                title=title,
-                company=company,
-                location=location,
-                experience=experience,
-                salary=salary,
-                description="",  # Will be filled when applying
-                url=job_url,
-                is_external=is_external
-            )
-            
-        except Exception as e:
-            logger.warning(f"Error extracting job details: {str(e)}")
-            return None
-    
     def is_external_application(self, job_url: str) -> bool:
         """Check if job application is external (redirects to company website)"""
         try:
-            # Check if URL contains external redirect indicators
-            external_indicators = [
-                'redirect', 'external', 'apply', 'careers', 'jobs'
-            ]
-            
             # Parse the URL to check domain
             parsed_url = urlparse(job_url)
             domain = parsed_url.netloc.lower()
@@ -247,72 +512,53 @@ class NaukriJobApplier:
                 return True
             
             # Check for external redirect patterns in the URL
-            for indicator in external_indicators:
-                if indicator in job_url.lower():
-                    return True
-            
-            return False
+            return bool(_EXTERNAL_URL_RE.search(job_url))
             
         except Exception as e:
             logger.warning(f"Error checking external application: {str(e)}")
             return False
     
-    def apply_to_job(self, job: JobDetails) -> bool:
+    def apply_to_job(self, job: JobDetails, driver: Optional[webdriver.Chrome] = None) -> bool:
         """Apply to a specific job"""
+        driver = driver or self.driver
         try:
             logger.info(f"Applying to: {job.title} at {job.company}")
             
-            # Open job in new tab
-            self.driver.execute_script(f"window.open('{job.url}', '_blank');")
-            self.driver.switch_to.window(self.driver.window_handles[-1])
-            time.sleep(3)
+            if self.shortlist_if_external(job):
+                return False
+            
+            # One HTTP round trip instead of a page load when the apply endpoint accepts it
+            if self.apply_via_api(job, driver):
+                self.mark_applied(job)
+                return True
+            
+            # Reuse the current tab instead of opening a new one per job
+            driver.get(job.url)
             
-            # Check if it's an external application
-            if job.is_external or self.is_external_application(self.driver.current_url):
+            # Wait for the apply button to become clickable instead of a fixed sleep
+            try:
+                apply_button = driver.wait.until(EC.element_to_be_clickable(APPLY_BUTTON))
+            except TimeoutException:
+                apply_button = None
+            
+            # Check if the job page redirected to an external site; the job URL itself was
+            # classified at extraction, so only a different URL needs checking
+            current_url = driver.current_url
+            if canonical_job_url(current_url) != job.url and self.is_external_application(current_url):
                 logger.info(f"External application detected for {job.title}. Shortlisting for manual application.")
-                self.shortlisted_jobs.append(job)
-                self.driver.close()
-                self.driver.switch_to.window(self.driver.window_handles[0])
+                self.shortlist.add(job)
                 return False
             
-            # Look for apply button
-            apply_button = None
-            apply_selectors = [
-                "//button[contains(text(), 'Apply')]",
-                "//a[contains(text(), 'Apply')]",
-                "//span[contains(text(), 'Apply')]",
-                ".apply-button",
-                "#apply-button"
-            ]
-            
-            for selector in apply_selectors:
-                try:
-                    if selector.startswith("//"):
-                        apply_button = self.driver.find_element(By.XPATH, selector)
-                    else:
-                        apply_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    break
-                except NoSuchElementException:
-                    continue
-            
             if not apply_button:
                 logger.warning(f"No apply button found for {job.title}")
-                self.driver.close()
-                self.driver.switch_to.window(self.driver.window_handles[0])
                 return False
             
             # Click apply button
             apply_button.click()
-            time.sleep(3)
             
             # Handle application form if it appears
-            if self.handle_application_form(job):
-                # Mark as applied
-                job.applied = True
-                job.application_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                self.applied_jobs.add(job.url)
-                self.save_applied_job(job.url, job.title, job.company)
-                logger.info(f"Successfully applied to {job.title} at {job.company}")
+            if self.handle_application_form(job, driver):
+                self.mark_applied(job)
                 return True
             else:
                 logger.warning(f"Failed to complete application for {job.title}")
@@ -321,23 +567,64 @@ class NaukriJobApplier:
         except Exception as e:
             logger.error(f"Error applying to job {job.title}: {str(e)}")
             return False
-        finally:
-            # Close current tab and switch back to main tab
-            try:
-                if len(self.driver.window_handles) > 1:
-                    self.driver.close()
-                    self.driver.switch_to.window(self.driver.window_handles[0])
-            except:
-                pass
     
-    def handle_application_form(self, job: JobDetails) -> bool:
+    def shortlist_if_external(self, job: JobDetails) -> bool:
+        """Shortlist a job already known from its listing to be external"""
+        # A missing quick-apply badge only means "unknown" unless skip_without_quick_apply is set,
+        # since the badge markup is a guess; those jobs still get their page and apply button checked
+        if job.is_external or (self.config.get('skip_without_quick_apply') and not job.quick_apply):
+            logger.info(f"External application detected for {job.title}. Shortlisting for manual application.")
+            self.shortlist.add(job)
+            return True
+        return False
+    
+    def apply_via_api(self, job: JobDetails, driver: webdriver.Chrome) -> bool:
+        """Apply through Naukri's apply endpoint using the browser session's cookies"""
+        api_url = self.config.get('apply_api_url')
+        if not api_url or not job.job_id:
+            return False
+        
+        # Build the HTTP session once per browser session, after login
+        session = getattr(driver, 'api_session', None)
+        if session is None:
+            session = requests.Session()
+            for cookie in driver.get_cookies():
+                session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'))
+            driver.api_session = session
+        
+        try:
+            response = session.post(api_url, json={"jobId": job.job_id}, headers=APPLY_API_HEADERS, timeout=15)
+            response.raise_for_status()
+            if response.json().get("status") == "SUCCESS":
+                return True
+            # Anything else (e.g. additional questions) goes through the browser flow
+            logger.info(f"Apply endpoint needs more input for {job.title}, using the browser")
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(f"Apply endpoint failed for {job.title}: {str(e)}")
+        return False
+    
+    def mark_applied(self, job: JobDetails):
+        """Record a successful application"""
+        job.applied = True
+        job.application_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.applied_jobs.add(job.url)
+        self.save_applied_job(job.url, job.title, job.company)
+        logger.info(f"Successfully applied to {job.title} at {job.company}")
+    
+    def handle_application_form(self, job: JobDetails, driver: Optional[webdriver.Chrome] = None) -> bool:
         """Handle job application form filling"""
+        driver = driver or self.driver
         try:
-            # Wait for form to load
-            time.sleep(2)
-            
-            # Check for additional questions or forms
-            form_elements = self.driver.find_elements(By.CSS_SELECTOR, "form, .application-form, .job-application")
+            # Check for additional questions or forms; a short timeout means there is no form.
+            # A success message ends the wait right away for jobs applied to in one click.
+            try:
+                outcome = driver.short_wait.until(EC.any_of(
+                    EC.presence_of_all_elements_located(APPLICATION_FORMS),
+                    EC.presence_of_element_located(SUCCESS_MESSAGE)
+                ))
+            except TimeoutException:
+                outcome = []
+            form_elements = outcome if isinstance(outcome, list) else []
             
             if not form_elements:
                 # No additional form, application might be direct
@@ -345,47 +632,41 @@ class NaukriJobApplier:
             
             # Handle common form fields
             for form in form_elements:
-                # Handle text inputs
-                text_inputs = form.find_elements(By.CSS_SELECTOR, "input[type='text'], textarea")
-                for input_field in text_inputs:
-                    field_name = input_field.get_attribute("name") or input_field.get_attribute("id") or ""
-                    field_name = field_name.lower()
+                # Read every field's name and options in one call, then only go back to the
+                # driver for the fields that get filled in
+                for field in driver.execute_script(DESCRIBE_FORM_FIELDS_JS, form):
+                    field_name = field['name']
+                    input_field = field['element']
                     
-                    if "experience" in field_name and "years" in field_name:
-                        input_field.clear()
-                        input_field.send_keys("3")
-                    elif "notice" in field_name:
-                        input_field.clear()
-                        input_field.send_keys(self.config.get('notice_period', '30'))
-                    elif "expected" in field_name and "salary" in field_name:
-                        input_field.clear()
-                        input_field.send_keys(self.config.get('expected_salary', '800000'))
-                    elif "current" in field_name and "salary" in field_name:
-                        input_field.clear()
-                        input_field.send_keys(self.config.get('current_salary', '600000'))
-                
-                # Handle dropdowns
-                dropdowns = form.find_elements(By.CSS_SELECTOR, "select")
-                for dropdown in dropdowns:
-                    try:
-                        dropdown_name = dropdown.get_attribute("name") or dropdown.get_attribute("id") or ""
-                        dropdown_name = dropdown_name.lower()
-                        
-                        if "experience" in dropdown_name:
+                    # Handle dropdowns
+                    if field['tag'] == 'select':
+                        if "experience" in field_name:
                             # Select appropriate experience option
-                            options = dropdown.find_elements(By.TAG_NAME, "option")
-                            for option in options:
-                                if "3" in option.text and ("year" in option.text.lower() or "yr" in option.text.lower()):
-                                    option.click()
+                            for index, option_text in enumerate(field['options']):
+                                option_lower = option_text.lower()
+                                if "3" in option_text and ("year" in option_lower or "yr" in option_lower):
+                                    try:
+                                        Select(input_field).select_by_index(index)
+                                    except WebDriverException:
+                                        pass
                                     break
-                    except:
                         continue
+                    
+                    # Handle text inputs
+                    for keywords, config_key, default in TEXT_FIELD_MAP:
+                        if all(keyword in field_name for keyword in keywords):
+                            input_field.clear()
+                            input_field.send_keys(str(self.config.get(config_key, default)))
+                            break
                 
                 # Submit form if submit button exists
-                submit_buttons = form.find_elements(By.CSS_SELECTOR, "button[type='submit'], input[type='submit'], .submit-btn")
+                submit_buttons = form.find_elements(*FORM_SUBMIT_BUTTONS)
                 if submit_buttons:
                     submit_buttons[0].click()
-                    time.sleep(3)
+                    try:
+                        driver.short_wait.until(EC.staleness_of(submit_buttons[0]))
+                    except TimeoutException:
+                        pass
                     return True
             
             return True
@@ -394,28 +675,45 @@ class NaukriJobApplier:
             logger.error(f"Error handling application form: {str(e)}")
             return False
     
-    def save_shortlisted_jobs(self):
-        """Save shortlisted jobs to CSV for manual application"""
-        if not self.shortlisted_jobs:
-            return
-        
-        filename = f"shortlisted_jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Title', 'Company', 'Location', 'Experience', 'Salary', 'URL', 'Reason'])
-            
-            for job in self.shortlisted_jobs:
-                writer.writerow([
-                    job.title,
-                    job.company,
-                    job.location,
-                    job.experience,
-                    job.salary,
-                    job.url,
-                    'External application or requires manual review'
-                ])
-        
-        logger.info(f"Shortlisted {len(self.shortlisted_jobs)} jobs saved to {filename}")
+    def apply_to_jobs_parallel(self, jobs: List[JobDetails], sessions: int) -> int:
+        """Apply to jobs using several logged-in browser sessions concurrently"""
+        # One driver per thread: a worker borrows a session from the pool for each job
+        pool = queue.Queue()
+        pool.put(self.driver)
+        extra_drivers = []
+        try:
+            for _ in range(sessions - 1):
+                driver = self.create_driver()
+                extra_drivers.append(driver)
+                try:
+                    self.login(driver)
+                except Exception:
+                    logger.warning("Could not log in additional browser session, continuing with fewer")
+                    continue
+                pool.put(driver)
+            
+            delay = self.config.get('delay_between_applications', 5)
+            logger.info(f"Applying with {pool.qsize()} parallel browser sessions")
+            
+            def worker(job: JobDetails) -> bool:
+                driver = pool.get()
+                try:
+                    # Keep the per-session delay between applications, but only wait for
+                    # what is left of it and never after a session's last job
+                    time.sleep(max(0.0, getattr(driver, 'ready_at', 0.0) - time.monotonic()))
+                    return self.apply_to_job(job, driver)
+                finally:
+                    driver.ready_at = time.monotonic() + delay
+                    pool.put(driver)
+            
+            with ThreadPoolExecutor(max_workers=pool.qsize()) as executor:
+                return sum(executor.map(worker, jobs))
+        finally:
+            for driver in extra_drivers:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
     
     def run(self):
         """Main execution method"""
@@ -432,24 +730,39 @@ class NaukriJobApplier:
                 logger.info("No new jobs found to apply")
                 return
             
-            # Apply to jobs
-            applied_count = 0
-            for job in jobs:
-                if self.apply_to_job(job):
-                    applied_count += 1
-                
-                # Add delay between applications
-                time.sleep(5)
+            if (self.config.get('skip_without_quick_apply') and jobs
+                    and not any(job.quick_apply for job in jobs)):
+                logger.warning("No listing showed a quick-apply badge, so every job will be shortlisted; "
+                               "the badge markup may have changed. Unset skip_without_quick_apply to check each job page.")
+            
+            # Shortlist known external jobs up front; they never load a page, so the
+            # delay between applications only has to separate the remaining jobs
+            jobs = [job for job in jobs if not self.shortlist_if_external(job)]
             
-            # Save shortlisted jobs
-            self.save_shortlisted_jobs()
+            # Apply to jobs
+            sessions = min(self.config.get('parallel_sessions', 1), len(jobs))
+            if sessions > 1:
+                applied_count = self.apply_to_jobs_parallel(jobs, sessions)
+            else:
+                applied_count = 0
+                delay = self.config.get('delay_between_applications', 5)
+                for i, job in enumerate(jobs, 1):
+                    if self.apply_to_job(job):
+                        applied_count += 1
+                    
+                    # Add delay between applications
+                    if i < len(jobs):  # Don't delay after last job
+                        time.sleep(delay)
             
             logger.info(f"Application process completed. Applied to {applied_count} jobs.")
-            logger.info(f"Shortlisted {len(self.shortlisted_jobs)} jobs for manual application.")
+            logger.info(f"Shortlisted {self.shortlist.count} jobs for manual application.")
             
         except Exception as e:
             logger.error(f"Error in main execution: {str(e)}")
         finally:
+            # Flush whatever was shortlisted, even if the run crashed part way
+            self.shortlist.close()
+            self.close_applied_jobs_csv()
             if self.driver:
                 self.driver.quit()
 
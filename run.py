@@ -6,23 +6,21 @@ Launcher script for Naukri Job Application Automation
 import sys
 import os
 import argparse
+import importlib.util
 from pathlib import Path
 
 def check_requirements():
     """Check if all requirements are met"""
-    try:
-        import selenium
-        import requests
-        import bs4
-        return True
-    except ImportError as e:
-        print(f"❌ Missing required package: {e}")
-        print("Please run: pip install -r requirements.txt")
-        return False
+    # find_spec locates a package without importing it; the applier imports them for real
+    for package in ("selenium", "requests", "bs4", "lxml"):
+        if importlib.util.find_spec(package) is None:
+            print(f"❌ Missing required package: {package}")
+            print("Please run: pip install -r requirements.txt")
+            return False
+    return True
 
-def check_config():
+def check_config(config_file: str = "config.json"):
     """Check if config file exists and is valid"""
-    config_file = "config.json"
     if not os.path.exists(config_file):
         print(f"❌ Config file {config_file} not found!")
         print("Please run: python setup.py")
@@ -65,7 +63,8 @@ def main():
     
     if args.setup:
         print("Running setup...")
-        os.system("python setup.py")
+        import setup
+        setup.main([])
         return
     
     # Check requirements
@@ -73,20 +72,27 @@ def main():
         sys.exit(1)
     
     # Check config
-    if not check_config():
+    if not check_config(args.config):
         sys.exit(1)
     
     # Create necessary directories
     Path('logs').mkdir(exist_ok=True)
     Path('output').mkdir(exist_ok=True)
     
-    # Run the appropriate version
+    # Run the appropriate version in this process; only the chosen module is imported,
+    # since each one configures logging on import
     if args.version == 'basic':
         print("Running basic version...")
-        os.system(f"python naukri_job_applier.py")
+        from naukri_job_applier import NaukriJobApplier as Applier
     else:
         print("Running enhanced version...")
-        os.system(f"python enhanced_naukri_applier.py")
+        from enhanced_naukri_applier import EnhancedNaukriJobApplier as Applier
+    
+    try:
+        Applier(config_file=args.config).run()
+    except Exception as e:
+        print(f"❌ Application failed: {e}")
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -3,27 +3,108 @@
 Setup script for Naukri Job Application Automation
 """
 
+import argparse
 import os
+import platform
 import sys
+import shutil
 import subprocess
 import json
-from pathlib import Path
+
+try:
+    import readline
+except ImportError:  # Not available on Windows
+    readline = None
+
+# Offered by the prompts and written as-is by --defaults
+DEFAULT_CONFIG = {
+    'email': "",
+    'password': "",
+    'notice_period': "30",
+    'current_salary': "600000",
+    'expected_salary': "800000",
+    'preferred_locations': ["Bangalore", "Mumbai", "Delhi", "Pune", "Hyderabad"],
+    'job_keywords': ["backend java developer", "java spring boot", "java backend"],
+    'experience_years': 3,
+    'max_applications_per_run': 20,
+    'delay_between_applications': 5,
+}
+
+def ask(prompt, default, prefill=True):
+    """Prompt for a value; Enter accepts the default"""
+    if readline and prefill:
+        # Pre-fill the line with the default so it can be accepted or edited in place.
+        # Lists are only hinted: typing a replacement would otherwise append to them.
+        readline.set_startup_hook(lambda: readline.insert_text(str(default)))
+        try:
+            return input(f"{prompt}: ").strip() or str(default)
+        finally:
+            readline.set_startup_hook()
+    return input(f"{prompt} [{default}]: ").strip() or str(default)
+
+def requirements_satisfied():
+    """Whether every pinned package in requirements.txt is already installed at its pinned version"""
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:  # Python 3.7; let pip decide
+        return False
+    
+    with open('requirements.txt', 'r') as f:
+        pins = [line.split('#')[0].strip() for line in f]
+    try:
+        return all(
+            '==' in pin and version(pin.split('==')[0].strip()) == pin.split('==')[1].strip()
+            for pin in pins if pin
+        )
+    except PackageNotFoundError:
+        return False
 
 def install_requirements():
     """Install required Python packages"""
+    # Reading installed package metadata is instant; pip takes seconds even when there is nothing to do
+    if requirements_satisfied():
+        print("✅ Requirements already satisfied!")
+        return True
+    
     print("Installing required packages...")
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+        uv = shutil.which("uv")
+        if uv:
+            # uv resolves and downloads in parallel; target this interpreter rather than uv's own choice
+            command = [uv, "pip", "install", "--python", sys.executable, "-r", "requirements.txt"]
+        else:
+            # Take an older wheel over building a newer sdist; lxml source builds need a compiler and take minutes
+            command = [sys.executable, "-m", "pip", "install", "--disable-pip-version-check",
+                       "--prefer-binary", "-r", "requirements.txt"]
+        subprocess.check_call(command)
         print("✅ Requirements installed successfully!")
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ Error installing requirements: {e}")
         return False
 
-def setup_config():
-    """Setup configuration file with user input"""
+def setup_config(use_defaults=False, from_file=None):
+    """Setup configuration file with user input, the defaults, or an existing JSON file"""
     print("\n🔧 Setting up configuration...")
     
+    if from_file:
+        try:
+            with open(from_file, 'r') as f:
+                config = {**DEFAULT_CONFIG, **json.load(f)}
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not read {from_file}: {e}")
+            return False
+        if not config['email'] or not config['password']:
+            print(f"❌ {from_file} must set email and password")
+            return False
+        return save_config(config)
+    
+    if use_defaults:
+        # Written without prompting; fill in the credentials in config.json afterwards
+        config = dict(DEFAULT_CONFIG)
+        print("Using defaults; add your Naukri.com email and password to config.json before running.")
+        return save_config(config)
+    
     config = {}
     
     # Get user credentials
@@ -33,32 +114,30 @@ def setup_config():
     
     # Get job preferences
     print("\nEnter your job preferences:")
-    config['notice_period'] = input("Notice period (in days) [30]: ").strip() or "30"
-    config['current_salary'] = input("Current salary (annual) [600000]: ").strip() or "600000"
-    config['expected_salary'] = input("Expected salary (annual) [800000]: ").strip() or "800000"
+    config['notice_period'] = ask("Notice period (in days)", DEFAULT_CONFIG['notice_period'])
+    config['current_salary'] = ask("Current salary (annual)", DEFAULT_CONFIG['current_salary'])
+    config['expected_salary'] = ask("Expected salary (annual)", DEFAULT_CONFIG['expected_salary'])
     
     # Get preferred locations
     print("\nEnter preferred locations (comma-separated):")
-    locations_input = input("Locations [Bangalore, Mumbai, Delhi, Pune, Hyderabad]: ").strip()
-    if locations_input:
-        config['preferred_locations'] = [loc.strip() for loc in locations_input.split(',')]
-    else:
-        config['preferred_locations'] = ["Bangalore", "Mumbai", "Delhi", "Pune", "Hyderabad"]
+    locations_input = ask("Locations", ", ".join(DEFAULT_CONFIG['preferred_locations']), prefill=False)
+    config['preferred_locations'] = [loc.strip() for loc in locations_input.split(',') if loc.strip()]
     
     # Get job keywords
     print("\nEnter job keywords (comma-separated):")
-    keywords_input = input("Keywords [backend java developer, java spring boot, java backend]: ").strip()
-    if keywords_input:
-        config['job_keywords'] = [kw.strip() for kw in keywords_input.split(',')]
-    else:
-        config['job_keywords'] = ["backend java developer", "java spring boot", "java backend"]
+    keywords_input = ask("Keywords", ", ".join(DEFAULT_CONFIG['job_keywords']), prefill=False)
+    config['job_keywords'] = [kw.strip() for kw in keywords_input.split(',') if kw.strip()]
     
     # Other settings
-    config['experience_years'] = int(input("Minimum experience years [3]: ").strip() or "3")
-    config['max_applications_per_run'] = int(input("Max applications per run [20]: ").strip() or "20")
-    config['delay_between_applications'] = int(input("Delay between applications (seconds) [5]: ").strip() or "5")
+    config['experience_years'] = int(ask("Minimum experience years", DEFAULT_CONFIG['experience_years']))
+    config['max_applications_per_run'] = int(ask("Max applications per run", DEFAULT_CONFIG['max_applications_per_run']))
+    config['delay_between_applications'] = int(ask("Delay between applications (seconds)",
+                                                   DEFAULT_CONFIG['delay_between_applications']))
     
-    # Save config
+    return save_config(config)
+
+def save_config(config):
+    """Write the configuration to config.json"""
     with open('config.json', 'w') as f:
         json.dump(config, f, indent=2)
     
@@ -69,16 +148,25 @@ def check_chrome():
     """Check if Chrome browser is installed"""
     print("\n🔍 Checking Chrome browser...")
     
-    chrome_paths = [
-        "/usr/bin/google-chrome",
-        "/usr/bin/chromium-browser",
-        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-        "C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe",
-        "C:\\Program Files (x86)\\Google\\Chrome\\Application\\chrome.exe"
-    ]
+    # A PATH lookup finds most Linux installs, including ones outside /usr/bin
+    for name in ("google-chrome", "google-chrome-stable", "chromium-browser", "chromium", "chrome"):
+        if shutil.which(name):
+            print("✅ Chrome browser found!")
+            return True
+    
+    # Only the install locations of the current platform; Windows prefixes come from the
+    # environment so other drive letters, localized folders and per-user installs are found
+    if sys.platform == "win32":
+        prefixes = [os.environ.get(var) for var in ("ProgramFiles", "ProgramFiles(x86)", "LOCALAPPDATA")]
+        chrome_paths = [os.path.join(prefix, "Google", "Chrome", "Application", "chrome.exe")
+                        for prefix in prefixes if prefix]
+    elif sys.platform == "darwin":
+        chrome_paths = ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"]
+    else:
+        chrome_paths = ["/usr/bin/google-chrome", "/usr/bin/chromium-browser"]
     
     for path in chrome_paths:
-        if os.path.exists(path):
+        if os.path.isfile(path):
             print("✅ Chrome browser found!")
             return True
     
@@ -90,13 +178,20 @@ def create_directories():
     """Create necessary directories"""
     print("\n📁 Creating directories...")
     
-    directories = ['logs', 'output']
-    for directory in directories:
-        Path(directory).mkdir(exist_ok=True)
+    for directory in ('logs', 'output'):
+        os.makedirs(directory, exist_ok=True)
         print(f"✅ Created directory: {directory}")
 
-def main():
+def main(argv=None):
     """Main setup function"""
+    parser = argparse.ArgumentParser(description='Setup for Naukri Job Application Automation')
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--defaults', action='store_true',
+                       help='Write config.json with default values instead of prompting')
+    group.add_argument('--from-file', metavar='PATH',
+                       help='Build config.json from an existing JSON file instead of prompting')
+    args = parser.parse_args(argv)
+    
     print("🚀 Naukri Job Application Automation Setup")
     print("=" * 50)
     
@@ -105,13 +200,10 @@ def main():
         print("❌ Python 3.7 or higher is required!")
         sys.exit(1)
     
-    print(f"✅ Python {sys.version.split()[0]} detected")
-    
-    # Install requirements
-    if not install_requirements():
-        sys.exit(1)
+    print(f"✅ Python {platform.python_version()} detected")
     
-    # Check Chrome
+    # Check Chrome first: it takes a few stat calls, so a missing browser
+    # stops setup before the slow package install rather than after it
     if not check_chrome():
         print("\n⚠️  Please install Chrome browser and run setup again.")
         sys.exit(1)
@@ -119,8 +211,12 @@ def main():
     # Create directories
     create_directories()
     
+    # Install requirements
+    if not install_requirements():
+        sys.exit(1)
+    
     # Setup configuration
-    if not setup_config():
+    if not setup_config(use_defaults=args.defaults, from_file=args.from_file):
         sys.exit(1)
     
     print("\n🎉 Setup completed successfully!")